@@ -1,9 +1,9 @@
 import logging
 
 from celery import Celery
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.core.database import create_db_engine_from_settings
-from app.core.otel import setup_open_telemetry
+from app.core.otel import setup_open_telemetry, shutdown_open_telemetry
 from app.core.settings import Settings
 
 from app.features import models  # noqa: F401
@@ -17,6 +17,23 @@ def create_celery_app(settings: Settings) -> Celery:
     app.conf.task_always_eager = settings.celery_task_always_eager
     app.conf.timezone = settings.celery_timezone
 
+    # Tasks are I/O-bound (database, SMTP, HTTP), so each worker process reserves only the task it is running
+    # instead of buffering several while sibling processes sit idle. Acknowledging after the task finishes means a
+    # message reserved by a busy or crashed process is handed to another one. Raise the multiplier for CPU-heavy loads.
+    # https://docs.celeryq.dev/en/stable/userguide/optimizing.html#prefetch-limits
+    app.conf.worker_prefetch_multiplier = settings.celery_worker_prefetch_multiplier
+    app.conf.task_acks_late = True
+
+    # Publishers reuse broker connections from a pool instead of connecting for every apply_async call.
+    # Retrying on startup keeps the current behaviour explicit; leaving it unset is deprecated in Celery 5.3+.
+    app.conf.broker_pool_limit = settings.celery_broker_pool_limit
+    app.conf.broker_connection_retry_on_startup = True
+
+    # Replace worker processes after a number of tasks or once their resident memory exceeds the limit (in KiB),
+    # so fragmentation and leaks in long-lived children are reclaimed before they grow unbounded.
+    app.conf.worker_max_tasks_per_child = settings.celery_worker_max_tasks_per_child
+    app.conf.worker_max_memory_per_child = settings.celery_worker_max_memory_per_child_kb
+
     # Ensure task modules are imported when the worker starts.
     # This makes task registration deterministic without needing to rely on
     # side-effect imports in worker entrypoints.
@@ -33,7 +50,17 @@ def create_celery_app(settings: Settings) -> Celery:
         db_engine = create_db_engine_from_settings(settings)
         setup_open_telemetry(app, db_engine, settings)
 
-    _ = worker_process_init.connect(weak=False)(init_celery_tracing)
+    # The factory can run more than once in a process (e.g. tests). Replace the receiver from any earlier call, so
+    # each child sets up tracing and its engine only once, and with the app and settings of the latest call.
+    _ = worker_process_init.disconnect(dispatch_uid="init_celery_tracing")  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType] (missing from celery-types stubs)
+    _ = worker_process_init.connect(weak=False, dispatch_uid="init_celery_tracing")(init_celery_tracing)
+
+    # Flush the spans, metrics and logs still buffered in a worker process before it exits.
+    def shutdown_celery_tracing(*args: object, **kwargs: object) -> None:
+        shutdown_open_telemetry(settings)
+
+    _ = worker_process_shutdown.disconnect(dispatch_uid="shutdown_celery_tracing")  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType] (missing from celery-types stubs)
+    _ = worker_process_shutdown.connect(weak=False, dispatch_uid="shutdown_celery_tracing")(shutdown_celery_tracing)
 
     # Make this app the default/current app so task decorators bind to it.
     app.set_current()
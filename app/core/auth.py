@@ -5,9 +5,15 @@ It provides a way to retrieve the current authenticated user based on a JWT toke
 Docs: https://fastapi.tiangolo.com/tutorial/security/
 """
 
-from datetime import datetime, timedelta, timezone
+import base64
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import blake2b
 import json
 import logging
+import time
+from types import MappingProxyType
 from typing import Annotated, Literal
 import uuid
 
@@ -19,7 +25,6 @@ from pydantic import BaseModel, ValidationError
 from starlette.datastructures import Headers
 from app.core.exceptions import ServiceException
 from app.core.settings import Settings, SettingsDep
-from app.core.timezone import utc_now
 from app.features.users.models.user import User, UserType
 
 logger = logging.getLogger(__name__)
@@ -48,26 +53,72 @@ class JwtDecodeAuthException(AuthException):
         super().__init__("JWT decode error")
 
 
+# The signing key is built once per secret and reused across requests.
+# PyJWT uses a PyJWK key as-is, without re-preparing the raw secret on every encode/decode.
+@lru_cache
+def get_jwt_signing_key(jwt_secret_key: str) -> jwt.PyJWK:
+    encoded_key = base64.urlsafe_b64encode(jwt_secret_key.encode()).rstrip(b"=").decode()
+    return jwt.PyJWK({"kty": "oct", "k": encoded_key}, algorithm="HS256")
+
+
+# Verified payloads are kept for a short while so that a token checked several times (authentication, cache keys,
+# refresh) only pays for signature verification once. Entries never outlive the token's own expiry,
+# and failed verifications are never cached. The cache is per secret so rotating the secret drops it.
+# Entries are keyed by a 128-bit blake2b fingerprint of the token rather than the token itself to keep them small.
+# Payloads are stored read-only, since every caller verifying the same token gets the same object.
+jwt_payload_cache_ttl_seconds = 60
+jwt_payload_cache_max_size = 10_000
+
+
+@lru_cache
+def get_jwt_payload_cache(jwt_secret_key: str) -> dict[bytes, tuple[float, Mapping[str, object]]]:
+    return {}
+
+
 class Authenticator:
     def __init__(self, settings: Settings):
         super().__init__()
         self.settings = settings
+        self.signing_key = get_jwt_signing_key(settings.jwt_secret_key)
+        self.payload_cache = get_jwt_payload_cache(settings.jwt_secret_key)
 
     def jwt_encode(self, payload: dict[str, object]) -> str:
         return jwt.encode(  # pyright: ignore[reportUnknownMemberType]
-            algorithm="HS256", key=self.settings.jwt_secret_key, payload=payload
+            algorithm="HS256", key=self.signing_key, payload=payload
         )
 
-    def jwt_decode(self, token: str) -> dict[str, object]:
-        return jwt.decode(  # pyright: ignore[reportUnknownMemberType]
-            token, self.settings.jwt_secret_key, algorithms=["HS256"]
+    def jwt_decode(self, token: str) -> Mapping[str, object]:
+        current_time = time.time()
+        token_key = blake2b(token.encode(), digest_size=16).digest()
+        cached = self.payload_cache.get(token_key)
+        if cached is not None:
+            cached_until, payload = cached
+            if current_time < cached_until:
+                return payload
+            _ = self.payload_cache.pop(token_key, None)
+
+        decoded_payload: dict[str, object] = jwt.decode(  # pyright: ignore[reportUnknownMemberType]
+            token, self.signing_key, algorithms=["HS256"]
         )
+        payload = MappingProxyType(decoded_payload)
+
+        # Only tokens that expire are cached, and never past their expiry
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            if len(self.payload_cache) >= jwt_payload_cache_max_size:
+                _ = self.payload_cache.pop(next(iter(self.payload_cache)), None)
+            self.payload_cache[token_key] = (min(exp, current_time + jwt_payload_cache_ttl_seconds), payload)
+        return payload
 
     def encode(self, user: User, requested_scopes: set[str] | None = None) -> tuple[str, str]:
-        """Encode a JWT access token + refresh token for the given user."""
-        current_time = utc_now()
-        access_exp = current_time + timedelta(minutes=self.settings.jwt_access_expiration_minutes)
-        refresh_exp = current_time + timedelta(minutes=self.settings.jwt_refresh_expiration_minutes)
+        """
+        Encode a JWT access token + refresh token for the given user.
+        Only the user's id, type, username, first_name and last_name are read.
+        """
+        # Timestamps are plain UNIX seconds, which is what PyJWT would convert datetimes to anyway
+        current_time = int(time.time())
+        access_exp = current_time + self.settings.jwt_access_expiration_minutes * 60
+        refresh_exp = current_time + self.settings.jwt_refresh_expiration_minutes * 60
 
         # Determine user scopes
         user_scopes = user.get_oauth2_scopes()
@@ -92,11 +143,12 @@ class Authenticator:
         )
 
         # Create JWT tokens
+        sub = str(user.id)
         user_dump = json.loads(auth_user.model_dump_json())
         access_token = self.jwt_encode(
             payload={
                 "type": "access",
-                "sub": str(user.id),
+                "sub": sub,
                 "exp": access_exp,
                 "user": user_dump,
                 "scope": scope,
@@ -105,7 +157,7 @@ class Authenticator:
         refresh_token = self.jwt_encode(
             payload={
                 "type": "refresh",
-                "sub": str(user.id),
+                "sub": sub,
                 "iat": current_time,
                 "exp": refresh_exp,
                 "scope": scope,
@@ -126,7 +178,7 @@ class Authenticator:
     def user(self, access_token: str) -> AuthUser:
         """Extract the user information from the given JWT access token."""
         try:
-            payload: dict[str, object] = self.jwt_decode(access_token)
+            payload: Mapping[str, object] = self.jwt_decode(access_token)
         except jwt.PyJWTError as e:
             raise JwtDecodeAuthException() from e
 
@@ -147,7 +199,7 @@ class Authenticator:
     def scopes(self, token: str) -> set[str]:
         """Extract the scopes from the given JWT token."""
         try:
-            payload: dict[str, object] = self.jwt_decode(token)
+            payload: Mapping[str, object] = self.jwt_decode(token)
         except jwt.PyJWTError as e:
             raise JwtDecodeAuthException() from e
 
@@ -157,7 +209,7 @@ class Authenticator:
     def sub(self, token: str) -> uuid.UUID:
         """Extract the subject (user ID) from the given JWT token."""
         try:
-            payload: dict[str, object] = self.jwt_decode(token)
+            payload: Mapping[str, object] = self.jwt_decode(token)
         except jwt.PyJWTError as e:
             raise JwtDecodeAuthException() from e
 
@@ -175,7 +227,7 @@ class Authenticator:
     def iat(self, token: str) -> datetime:
         """Extract the issued-at time from the given JWT token."""
         try:
-            payload: dict[str, object] = self.jwt_decode(token)
+            payload: Mapping[str, object] = self.jwt_decode(token)
         except jwt.PyJWTError as e:
             raise JwtDecodeAuthException() from e
 
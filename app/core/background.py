@@ -53,7 +53,7 @@ class CeleryBackgroundTask(BackgroundTask):
     async def submit(self, input_model: BaseModel) -> None:
         task_input_raw = input_model.model_dump_json()
         self.result = self.celery_task.apply_async(kwargs={"raw_task_input": task_input_raw})
-        logger.info(f"Submitted background task {self.celery_task.name} with id {self.result.id}")
+        logger.info("Submitted background task %s with id %s", self.celery_task.name, self.result.id)
 
     @override
     def wait_and_get_result[T: BaseModel](self, output_cls: type[T], timeout: float | None = None) -> T:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 from hashlib import sha256
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import Depends, Request
 from aiocache import BaseCache, Cache as AioCache
@@ -31,22 +31,21 @@ class Cache[T]:
         self.backend = backend
         self.value_cls = value_cls
         self.key = key
+        self.hashed_key = hash_cache_key(key)
         self.ttl = ttl
 
     async def set(self, value: T) -> T:
         """Set a value in the cache with the specified TTL."""
         cache_value = CachableContainer(value=value)
         persist_value = cache_value.model_dump_json()
-        hashed_key = sha256(self.key.encode()).hexdigest()
-        await self.backend.set(hashed_key, persist_value, self.ttl)  # pyright: ignore[reportUnknownMemberType]
+        await self.backend.set(self.hashed_key, persist_value, self.ttl)  # pyright: ignore[reportUnknownMemberType]
         logger.info("Cached value under key %s for %d seconds", self.key, self.ttl)
         return value
 
     async def get(self) -> T | None:
         """Get a value from the cache."""
         logger.info("Fetching cached value under key %s", self.key)
-        hashed_key = sha256(self.key.encode()).hexdigest()
-        persist_value = await self.backend.get(hashed_key)  # pyright: ignore[reportUnknownMemberType]
+        persist_value = await self.backend.get(self.hashed_key)  # pyright: ignore[reportUnknownMemberType]
         if persist_value is None:
             return None
 
@@ -58,10 +57,18 @@ class Cache[T]:
             return None
 
 
+def hash_cache_key(key: str) -> str:
+    """Hash a cache key into the fixed-length form stored in the backend."""
+    return sha256(key.encode()).hexdigest()
+
+
 # Cache Builder to create Cache instances with varying keys and TTLs.
 # ----------------------------------------------------------------------------------------------------------------------
 
 
+type CacheVarySource = Literal["path", "auth", "query"]
+
+
 @dataclass
 class CacheBuilderState:
     key: str
@@ -80,24 +87,37 @@ class CacheBuilder:
         """Modify the cache key to vary based on a custom method and value."""
         return self.with_key(f"{self.state.key}:[{method}:{value}]")
 
+    def vary_on(self, *sources: CacheVarySource) -> "CacheBuilder":
+        """Modify the cache key to vary on several request attributes, building the key in a single pass."""
+        components = (f"[{source}:{self.vary_value(source)}]" for source in sources)
+        return self.with_key(":".join((self.state.key, *components)))
+
     def vary_on_path(self) -> "CacheBuilder":
         """Modify the cache key to vary based on the request path."""
-        return self.vary("path", self.request.url.path)
+        return self.vary_on("path")
 
     def vary_on_auth(self) -> "CacheBuilder":
         """Modify the cache key to vary based on the Authorization header."""
-        try:
-            access_token = self.authenticator.access_token_from_headers(self.request.headers)
-            user_id = self.authenticator.sub(access_token)
-            return self.vary("auth", str(user_id))
-        except AuthException:
-            return self.vary("auth", "anonymous")
+        return self.vary_on("auth")
 
     def vary_on_query(self) -> "CacheBuilder":
         """Modify the cache key to vary based on the query parameters."""
-        items = sorted(self.request.query_params.items())
-        canonical = "&".join(f"{k}={v}" for k, v in items)
-        return self.vary("query", canonical)
+        return self.vary_on("query")
+
+    def vary_value(self, source: CacheVarySource) -> str:
+        """Resolve the value a request attribute contributes to the cache key."""
+        match source:
+            case "path":
+                return self.request.url.path
+            case "auth":
+                try:
+                    access_token = self.authenticator.access_token_from_headers(self.request.headers)
+                    return str(self.authenticator.sub(access_token))
+                except AuthException:
+                    return "anonymous"
+            case "query":
+                items = sorted(self.request.query_params.items())
+                return "&".join(f"{k}={v}" for k, v in items)
 
     def with_ttl(self, ttl: int) -> "CacheBuilder":
         """Set a custom TTL for the cache."""
@@ -109,6 +129,11 @@ class CacheBuilder:
         self.state = CacheBuilderState(key=key, ttl=self.state.ttl)
         return self
 
+    async def invalidate(self) -> None:
+        """Remove the value cached under the current key, e.g. after the data behind it has changed."""
+        await self.backend.delete(hash_cache_key(self.state.key))  # pyright: ignore[reportUnknownMemberType]
+        logger.info("Invalidated cached value under key %s", self.state.key)
+
     def build[T](self, cls: type[T]) -> Cache[T]:
         """Build the Cache instance."""
         return Cache[T](backend=self.backend, value_cls=cls, key=self.state.key, ttl=self.state.ttl)
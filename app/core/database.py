@@ -16,7 +16,8 @@ import logging
 import uuid
 from fastapi import Depends
 from fast_depends import Depends as WorkerDepends
-from sqlalchemy import UUID, inspect
+from sqlalchemy import JSON, UUID, inspect, make_url
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, RelationshipProperty, attributes, mapped_column
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
@@ -26,6 +27,12 @@ from app.core.settings import SettingsDep
 
 logger = logging.getLogger(__name__)
 
+# JSON column type, stored as JSONB on PostgreSQL so values are parsed once on write instead of on every read.
+# Other dialects keep plain JSON.
+# ----------------------------------------------------------------------------------------------------------------------
+
+JSONB = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
 # The base class for ORM models.
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -102,7 +109,16 @@ class Base(DeclarativeBase):
 
 
 @lru_cache
-def create_db_engine(database_url: str, debug: bool = False, no_pooling: bool = False):
+def create_db_engine(
+    database_url: str,
+    debug: bool = False,
+    no_pooling: bool = False,
+    *,
+    pool_size: int,
+    pool_max_overflow: int,
+    pool_timeout_seconds: int,
+    pool_recycle_seconds: int,
+):
     logger.info("Creating database engine", extra={"database_url": database_url})
     engine_kwargs: dict[str, object] = {"echo": debug}
     # asyncpg connections are bound to their event loop; using NullPool prevents
@@ -110,12 +126,36 @@ def create_db_engine(database_url: str, debug: bool = False, no_pooling: bool =
     # in another loop (e.g., FastAPI request), which triggers "Future attached to a different loop".
     if no_pooling:
         engine_kwargs["poolclass"] = NullPool
+    # Size the PostgreSQL pool for concurrent requests. Requests beyond pool_size + max_overflow wait at most
+    # pool_timeout for a connection instead of piling up, and connections are recycled before servers drop them.
+    elif make_url(database_url).get_backend_name() == "postgresql":
+        engine_kwargs["pool_size"] = pool_size
+        engine_kwargs["max_overflow"] = pool_max_overflow
+        engine_kwargs["pool_timeout"] = pool_timeout_seconds
+        engine_kwargs["pool_recycle"] = pool_recycle_seconds
+    # asyncpg prepares every statement server-side and keeps them per connection, so handlers with a stable
+    # statement shape (login, detail, list...) skip parse/plan once warm. Size the cache above the default of 100.
+    if make_url(database_url).drivername == "postgresql+asyncpg":
+        engine_kwargs["connect_args"] = {"prepared_statement_cache_size": 256}
+    # sqlite3's legacy transaction control emits no BEGIN before a SAVEPOINT, so a savepoint can become the outermost
+    # transaction and releasing it commits. autocommit=False keeps a transaction open, as other drivers do.
+    # See "Enabling Non-Legacy SQLite Transactional Modes" in the SQLAlchemy SQLite dialect docs.
+    elif make_url(database_url).drivername == "sqlite+aiosqlite":
+        engine_kwargs["connect_args"] = {"autocommit": False}
     return create_async_engine(database_url, **engine_kwargs)
 
 
 def create_db_engine_from_settings(settings: SettingsDep):
     no_pooling = settings.celery_task_always_eager
-    return create_db_engine(settings.database_url, debug=settings.debug, no_pooling=no_pooling)
+    return create_db_engine(
+        settings.database_url,
+        debug=settings.debug,
+        no_pooling=no_pooling,
+        pool_size=settings.database_pool_size,
+        pool_max_overflow=settings.database_pool_max_overflow,
+        pool_timeout_seconds=settings.database_pool_timeout_seconds,
+        pool_recycle_seconds=settings.database_pool_recycle_seconds,
+    )
 
 
 async def get_db_session(settings: SettingsDep):
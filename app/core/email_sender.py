@@ -55,7 +55,7 @@ class EmailSender(abc.ABC):
             try:
                 return mjml2html(content)
             except Exception:
-                logger.error(f"Failed to compile MJML to HTML: \n{content}", exc_info=True)
+                logger.error("Failed to compile MJML to HTML: \n%s", content, exc_info=True)
 
         return content
 
@@ -69,10 +69,10 @@ class LocalEmailSender(EmailSender):
     async def send_email(self, email: Email) -> str:
         body_html = self.render("html", email.body_html_template, email.template_data)
         body_text = self.render("text", email.body_text_template, email.template_data)
-        logger.info(f"Simulated sending email to {email.receivers}")
-        logger.debug(f"Email Subject: {email.subject}")
-        logger.debug(f"Email Body (Text): {body_text}")
-        logger.debug(f"Email Body (HTML): {body_html}")
+        logger.info("Simulated sending email to %s", email.receivers)
+        logger.debug("Email Subject: %s", email.subject)
+        logger.debug("Email Body (Text): %s", body_text)
+        logger.debug("Email Body (HTML): %s", body_html)
         return "local-message-id-placeholder"
 
 
@@ -112,10 +112,10 @@ class SmtpEmailSender(EmailSender):
                 _ = server.login(self.settings.email_smtp_username, self.settings.email_smtp_password)
             _ = server.send_message(message)
             _ = server.quit()
-            logger.info(f"Sent email to {email.receivers} via SMTP")
+            logger.info("Sent email to %s via SMTP", email.receivers)
             return "smtp-message-id-placeholder"
         except Exception as e:
-            logger.error(f"Failed to send email via SMTP: {e}")
+            logger.error("Failed to send email via SMTP: %s", e)
             raise
 
 
@@ -8,6 +8,16 @@ from typing import ParamSpec, TypeVar
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Event loop used to run async code outside of uvicorn (which already picks uvloop by itself).
+# uvloop is installed with uvicorn's standard extras on POSIX only, so fall back to the default loop without it.
+event_loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+try:
+    import uvloop
+
+    event_loop_factory = uvloop.new_event_loop
+except ImportError:
+    event_loop_factory = None
+
 
 def inspect_augment_signature(signature: Signature, *extra: Parameter) -> Signature:
     """
@@ -50,14 +60,14 @@ def run_as_sync(func: Callable[P, Coroutine[object, object, R]], *args: P.args,
     try:
         _ = asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(func(*args, **kwargs))
+        return asyncio.run(func(*args, **kwargs), loop_factory=event_loop_factory)
 
     result_container: dict[str, R] = {}
     error_container: dict[str, BaseException] = {}
 
     def runner():
         try:
-            result_container["result"] = asyncio.run(func(*args, **kwargs))
+            result_container["result"] = asyncio.run(func(*args, **kwargs), loop_factory=event_loop_factory)
         except Exception as exc:
             error_container["error"] = exc
 
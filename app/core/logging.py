@@ -18,6 +18,11 @@ def setup_logging(settings: Settings):
 
     log_level = settings.logger_level.upper()
 
+    # None of the handlers output the process or asyncio task name,
+    # so skip looking them up for every log record that is created.
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # pyright: ignore[reportAttributeAccessIssue] (missing from the stubs)
+
     logging.config.dictConfig(
         {
             "version": 1,
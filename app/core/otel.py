@@ -11,28 +11,6 @@ Open Telemetry Python Docs: https://opentelemetry-python-contrib.readthedocs.io
 
 from celery import Celery
 from fastapi import FastAPI
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.instrumentation.asyncio import AsyncioInstrumentor
-from opentelemetry.instrumentation.sqlite3 import SQLite3Instrumentor
-from opentelemetry.instrumentation.threading import ThreadingInstrumentor
-from opentelemetry.instrumentation.urllib import URLLibInstrumentor
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
-from opentelemetry.instrumentation.celery import CeleryInstrumentor
-from opentelemetry.metrics import set_meter_provider
-from opentelemetry.sdk._logs import LoggerProvider
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.trace import set_tracer_provider
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
 from sqlalchemy.ext.asyncio import AsyncEngine
 from app.core.settings import Settings
 
@@ -41,6 +19,31 @@ def setup_open_telemetry(app: FastAPI | Celery, db_engine: AsyncEngine, settings
     if not settings.otel_enabled:
         return
 
+    # The Open Telemetry SDK, exporters and instrumentations take a noticeable time to import,
+    # so they are only imported when Open Telemetry is enabled.
+    from opentelemetry._logs import set_logger_provider
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+    from opentelemetry.instrumentation.asyncio import AsyncioInstrumentor
+    from opentelemetry.instrumentation.sqlite3 import SQLite3Instrumentor
+    from opentelemetry.instrumentation.threading import ThreadingInstrumentor
+    from opentelemetry.instrumentation.urllib import URLLibInstrumentor
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.metrics import set_meter_provider
+    from opentelemetry.sdk._logs import LoggerProvider
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.trace import set_tracer_provider
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+
     # Integrated Open Telemetry Python Libraries
     # https://opentelemetry-python-contrib.readthedocs.io
     AsyncioInstrumentor().instrument()
@@ -95,3 +98,21 @@ def setup_open_telemetry(app: FastAPI | Celery, db_engine: AsyncEngine, settings
     logger_provider = LoggerProvider(resource=resource)
     logger_provider.add_log_record_processor(log_processor)
     set_logger_provider(logger_provider)
+
+
+def shutdown_open_telemetry(settings: Settings):
+    if not settings.otel_enabled:
+        return
+
+    from opentelemetry._logs import get_logger_provider
+    from opentelemetry.metrics import get_meter_provider
+    from opentelemetry.trace import get_tracer_provider
+    from opentelemetry.sdk._logs import LoggerProvider
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.trace import TracerProvider
+
+    # The providers flush their batch processors from an atexit hook, but Celery pool processes exit through
+    # os._exit, which skips atexit. Shut them down explicitly so the last batch is exported when a child exits.
+    for provider in (get_tracer_provider(), get_meter_provider(), get_logger_provider()):
+        if isinstance(provider, TracerProvider | MeterProvider | LoggerProvider):
+            provider.shutdown()
@@ -2,9 +2,14 @@
 This module provides pagination utilities for database queries.
 """
 
+import base64
 from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+import uuid
 from pydantic import BaseModel
-from sqlalchemy import Select, func, select
+from sqlalchemy import Row, Select, func, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.core.database import DbDep
 
@@ -33,9 +38,77 @@ class Page[DataT](BaseModel):
 
 async def paginate[DataT](db: DbDep, stmt: Select[tuple[DataT]], limit: int = 100, offset: int = 0) -> Page[DataT]:
     """Paginates the given SQLAlchemy Select statement."""
-    total_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(total_stmt)
-    total = total_result.scalar_one()
+    total = await count_total(db, stmt)
     data_result = await db.execute(stmt.limit(limit).offset(offset))
     data = list(data_result.scalars().all())
     return Page(count=total, items=data)
+
+
+async def count_total(db: DbDep, stmt: Select[Any]) -> int:
+    """
+    Counts the rows the given SQLAlchemy Select statement would return without pagination.
+    Ordering is dropped first since it does not affect the count and would otherwise be applied inside the subquery.
+    """
+    total_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+    total_result = await db.execute(total_stmt)
+    return total_result.scalar_one()
+
+
+# Keyset (cursor) pagination
+# Pages are continued from the (sort value, id) of the last row instead of an OFFSET, so deep pages cost the same as
+# the first one and no COUNT query is needed. The sort column and id must be backed by a composite index.
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+class CursorPage[DataT](BaseModel):
+    """A cursor paginated response model. Pass `next_cursor` back to fetch the following page."""
+
+    items: list[DataT]
+    next_cursor: str | None
+
+
+def encode_cursor(sort_key: str, sort_value: datetime, row_id: uuid.UUID) -> str:
+    """Encodes the position of a row, and the name of the column it is sorted by, into an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{sort_key}|{sort_value.isoformat()}|{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Decodes a cursor produced by `encode_cursor` for the given sort column name.
+    Raises `ValueError` if it is malformed or was issued for a different sort column.
+    """
+    raw_sort_key, raw_sort_value, raw_row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    if raw_sort_key != sort_key:
+        raise ValueError("Cursor was issued for a different sort column")
+    sort_value = datetime.fromisoformat(raw_sort_value)
+    if sort_value.tzinfo is None:
+        raise ValueError("Cursor timestamp must be timezone aware")
+    return sort_value, uuid.UUID(raw_row_id)
+
+
+async def paginate_keyset_rows[RowT: tuple[Any, ...], DataT](
+    db: DbDep,
+    stmt: Select[RowT],
+    function: Callable[[Row[RowT]], DataT],
+    sort_column: InstrumentedAttribute[datetime],
+    id_column: InstrumentedAttribute[uuid.UUID],
+    after: tuple[datetime, uuid.UUID] | None = None,
+    limit: int = 100,
+) -> CursorPage[DataT]:
+    """
+    Paginates a SQLAlchemy Select statement over individual columns in (sort_column, id_column) order.
+    The statement must select both columns; one extra row is fetched to tell whether there is a next page.
+    Pass the position decoded from a cursor (see `decode_cursor`, with the sort column's key) as `after` to fetch the
+    rows following it.
+    """
+    if after is not None:
+        stmt = stmt.where(tuple_(sort_column, id_column) > after)
+    data_result = await db.execute(stmt.order_by(sort_column, id_column).limit(limit + 1))
+    rows = data_result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1]._mapping  # pyright: ignore[reportPrivateUsage] (public API despite the underscore)
+        next_cursor = encode_cursor(sort_column.key, last_row[sort_column], last_row[id_column])
+    return CursorPage(items=[function(row) for row in rows], next_cursor=next_cursor)
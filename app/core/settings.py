@@ -35,6 +35,10 @@ class Settings(BaseSettings):
     password_reset_expiration_minutes: int = 60
 
     database_url: str = "sqlite+aiosqlite:///./sqlite.db"
+    database_pool_size: int = 20
+    database_pool_max_overflow: int = 10
+    database_pool_timeout_seconds: int = 30
+    database_pool_recycle_seconds: int = 30 * 60
 
     cache_url: str = "memory://"
 
@@ -44,6 +48,10 @@ class Settings(BaseSettings):
     celery_broker_url: str = "sqla+sqlite:///sqlite.celery.db"
     celery_result_backend_url: str = "rpc"
     celery_timezone: str = "UTC"
+    celery_worker_prefetch_multiplier: int = 1
+    celery_broker_pool_limit: int = 10
+    celery_worker_max_tasks_per_child: int = 1000
+    celery_worker_max_memory_per_child_kb: int = 300_000
 
     otel_enabled: bool = False
     otel_resource_service_name: str = "backend"
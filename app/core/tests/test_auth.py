@@ -3,6 +3,7 @@ import uuid
 import pytest
 import pytest_asyncio
 from fastapi.security import SecurityScopes
+import jwt
 import time_machine
 
 from app.core.auth import (
@@ -12,6 +13,7 @@ from app.core.auth import (
     AuthorizationFailedException,
     get_current_user,
     get_authenticator,
+    get_jwt_signing_key,
 )
 from starlette.datastructures import Headers
 from app.core.auth import Authenticator
@@ -57,6 +59,64 @@ def test_get_authenticator_returns_authenticator_configured_with_settings(settin
     assert isinstance(authenticator, Authenticator)
 
 
+def test_get_jwt_signing_key_is_reused_for_the_same_secret():
+    assert get_jwt_signing_key("secret") is get_jwt_signing_key("secret")
+    assert get_jwt_signing_key("secret") is not get_jwt_signing_key("other-secret")
+
+
+def test_jwt_encode_signs_tokens_with_the_raw_secret(authenticator_fixture: Authenticator, settings_fixture: Settings):
+    token = authenticator_fixture.jwt_encode(payload={"sub": "subject"})
+    payload = jwt.decode(token, settings_fixture.jwt_secret_key, algorithms=["HS256"])  # pyright: ignore[reportUnknownMemberType]
+    assert payload == {"sub": "subject"}
+
+
+def test_jwt_decode_rejects_tokens_signed_with_another_secret(authenticator_fixture: Authenticator):
+    token = jwt.encode({"sub": "subject"}, "another-secret", algorithm="HS256")  # pyright: ignore[reportUnknownMemberType]
+    with pytest.raises(jwt.InvalidSignatureError):
+        _ = authenticator_fixture.jwt_decode(token)
+
+
+def test_jwt_decode_reuses_verified_payload_for_the_same_token(authenticator_fixture: Authenticator):
+    token = authenticator_fixture.jwt_encode(
+        payload={"sub": "subject", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)}
+    )
+    assert authenticator_fixture.jwt_decode(token) is authenticator_fixture.jwt_decode(token)
+
+
+def test_jwt_decode_returns_a_read_only_payload(authenticator_fixture: Authenticator):
+    token = authenticator_fixture.jwt_encode(
+        payload={"sub": "subject", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)}
+    )
+    payload = authenticator_fixture.jwt_decode(token)
+    with pytest.raises(TypeError):
+        payload["sub"] = "someone-else"  # pyright: ignore[reportIndexIssue]
+    assert authenticator_fixture.jwt_decode(token)["sub"] == "subject"
+
+
+def test_jwt_decode_does_not_serve_cached_payload_for_a_tampered_token(authenticator_fixture: Authenticator):
+    token = authenticator_fixture.jwt_encode(
+        payload={"sub": "subject", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)}
+    )
+    _ = authenticator_fixture.jwt_decode(token)
+
+    header, payload, signature = token.split(".")
+    tampered_signature = ("A" if signature[0] != "A" else "B") + signature[1:]
+    with pytest.raises(jwt.InvalidSignatureError):
+        _ = authenticator_fixture.jwt_decode(f"{header}.{payload}.{tampered_signature}")
+
+
+def test_jwt_decode_does_not_serve_cached_payload_past_token_expiry(authenticator_fixture: Authenticator):
+    with time_machine.travel("2025-01-01 00:00:00"):
+        token = authenticator_fixture.jwt_encode(
+            payload={"sub": "subject", "exp": datetime.now(timezone.utc) + timedelta(seconds=30)}
+        )
+        _ = authenticator_fixture.jwt_decode(token)
+
+    with time_machine.travel("2025-01-01 00:00:31"):
+        with pytest.raises(jwt.ExpiredSignatureError):
+            _ = authenticator_fixture.jwt_decode(token)
+
+
 # Tests for access_token_from_headers
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -167,6 +227,21 @@ def test_encode_does_not_add_task_claim_in_non_debug_mode_for_admin_users(
     assert "task" not in token_scopes
 
 
+def test_encode_sets_expirations_relative_to_issue_time(
+    authenticator_fixture: Authenticator, settings_fixture: Settings, user_fixture: User
+):
+    with time_machine.travel("2025-01-01 00:00:00"):
+        issued_at = int(datetime.now(timezone.utc).timestamp())
+        access_token, refresh_token = authenticator_fixture.encode(user_fixture)
+
+        access_payload = authenticator_fixture.jwt_decode(access_token)
+        refresh_payload = authenticator_fixture.jwt_decode(refresh_token)
+
+    assert access_payload["exp"] == issued_at + settings_fixture.jwt_access_expiration_minutes * 60
+    assert refresh_payload["iat"] == issued_at
+    assert refresh_payload["exp"] == issued_at + settings_fixture.jwt_refresh_expiration_minutes * 60
+
+
 # JWT User Tests
 # ----------------------------------------------------------------------------------------------------------------------
 
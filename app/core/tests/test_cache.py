@@ -87,6 +87,17 @@ def test_vary_chains_components_in_cache_key(cache_fixture: CacheDep):
     assert cache.key == "cache:[path:/test/path]:[auth:anonymous]"
 
 
+def test_vary_on_builds_same_key_as_chained_vary_calls(cache_fixture: CacheDep, request_fixture: Request):
+    chained = cache_fixture.vary_on_path().vary_on_query().vary_on_auth().build(str)
+    combined = CacheBuilder(
+        backend=cache_fixture.backend, request=request_fixture, authenticator=cache_fixture.authenticator
+    )
+    cache = combined.vary_on("path", "query", "auth").build(str)
+    assert cache.key == "cache:[path:/test/path]:[query:param1=value1&param2=value2]:[auth:anonymous]"
+    assert cache.key == chained.key
+    assert cache.hashed_key == chained.hashed_key
+
+
 # Cache get / set behavior
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -141,6 +152,16 @@ async def test_distinct_cache_instances_do_not_collide_on_different_keys(cache_f
     assert await cache2.get() == ExampleModel(a=2, b="auth-value")
 
 
+@pytest.mark.asyncio
+async def test_invalidate_removes_value_cached_under_same_key(cache_fixture: CacheDep):
+    result_cache = cache_fixture.vary_on_path().with_ttl(10).build(ExampleModel)
+    _ = await result_cache.set(ExampleModel(a=1, b="stale"))
+
+    await cache_fixture.invalidate()
+
+    assert await result_cache.get() is None
+
+
 @pytest.mark.asyncio
 async def test_get_returns_none_for_missing_cache_entry(cache_fixture: CacheDep):
     cache = cache_fixture.with_ttl(10).build(ExampleModel)
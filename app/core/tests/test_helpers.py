@@ -1,3 +1,4 @@
+import asyncio
 from inspect import Parameter, Signature
 
 import pytest
@@ -128,6 +129,15 @@ def test_background_task_runs_synchronously_when_event_loop_missing():
     assert result == 5
 
 
+def test_background_task_runs_on_uvloop_when_available():
+    uvloop = pytest.importorskip("uvloop")
+
+    async def is_uvloop() -> bool:
+        return isinstance(asyncio.get_running_loop(), uvloop.Loop)
+
+    assert run_as_sync(is_uvloop)
+
+
 @pytest.mark.asyncio
 async def test_background_task_runs_as_coroutine_when_event_loop_present():
     async def sample_task(x: int, y: int) -> int:
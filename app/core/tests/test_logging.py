@@ -1,3 +1,4 @@
+import logging
 import logging.config
 from unittest.mock import MagicMock
 import pytest
@@ -13,10 +14,12 @@ def dictconfig_fixture(monkeypatch: pytest.MonkeyPatch):
     return spy
 
 
-def test_setup_logging_without_otel(settings_fixture: Settings, dictconfig_fixture: MagicMock):
-    settings_fixture.otel_enabled = False
-    settings_fixture.logger_name = "console"
-    settings_fixture.logger_level = "info"
+def test_setup_logging_without_otel(
+    settings_fixture: Settings, dictconfig_fixture: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings_fixture, "otel_enabled", False)
+    monkeypatch.setattr(settings_fixture, "logger_name", "console")
+    monkeypatch.setattr(settings_fixture, "logger_level", "info")
     setup_logging(settings_fixture)
 
     dictconfig_fixture.assert_called_once()
@@ -26,10 +29,12 @@ def test_setup_logging_without_otel(settings_fixture: Settings, dictconfig_fixtu
     assert config["loggers"]["root"]["level"] == "INFO"
 
 
-def test_setup_logging_with_otel_enabled(settings_fixture: Settings, dictconfig_fixture: MagicMock):
-    settings_fixture.otel_enabled = True
-    settings_fixture.logger_name = "console"
-    settings_fixture.logger_level = "debug"
+def test_setup_logging_with_otel_enabled(
+    settings_fixture: Settings, dictconfig_fixture: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings_fixture, "otel_enabled", True)
+    monkeypatch.setattr(settings_fixture, "logger_name", "console")
+    monkeypatch.setattr(settings_fixture, "logger_level", "debug")
     setup_logging(settings_fixture)
     dictconfig_fixture.assert_called_once()
     config = dictconfig_fixture.call_args.args[0]
@@ -38,3 +43,16 @@ def test_setup_logging_with_otel_enabled(settings_fixture: Settings, dictconfig_
     assert "console" in handlers
     assert "otel" in handlers
     assert config["loggers"]["root"]["level"] == "DEBUG"
+
+
+def test_setup_logging_skips_unused_record_attributes(
+    settings_fixture: Settings, dictconfig_fixture: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    # Both flags are process-global; monkeypatch restores them once the test is done
+    monkeypatch.setattr(logging, "logMultiprocessing", True)
+    monkeypatch.setattr(logging, "logAsyncioTasks", True)
+    setup_logging(settings_fixture)
+
+    record = logging.makeLogRecord({})
+    assert record.processName is None
+    assert record.taskName is None
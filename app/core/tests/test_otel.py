@@ -1,9 +1,11 @@
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from fastapi import FastAPI
 from pytest import MonkeyPatch
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from app.core.otel import setup_open_telemetry
+from app.celery import create_celery_app
+from app.core.otel import setup_open_telemetry, shutdown_open_telemetry
 from app.core.settings import Settings
 from unittest.mock import MagicMock
 
@@ -12,7 +14,7 @@ def test_setup_open_telemetry_skips_instrumentation_when_disabled(
     db_engine_fixture: AsyncEngine, monkeypatch: MonkeyPatch
 ):
     mock_intr = MagicMock()
-    monkeypatch.setattr("app.core.otel.AsyncioInstrumentor", mock_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.asyncio.AsyncioInstrumentor", mock_intr)
 
     app = FastAPI()
     setup_open_telemetry(app, db_engine_fixture, Settings(otel_enabled=False))
@@ -28,14 +30,14 @@ def test_setup_open_telemetry_instruments_fastapi_dependencies_when_enabled(
     mock_fastapi_intr = MagicMock()
     mock_celery_intr = MagicMock()
 
-    monkeypatch.setattr("app.core.otel.AsyncioInstrumentor", mock_asyncio_intr)
-    monkeypatch.setattr("app.core.otel.LoggingInstrumentor", mock_logging_intr)
-    monkeypatch.setattr("app.core.otel.SQLAlchemyInstrumentor", mock_sqlalchemy_intr)
-    monkeypatch.setattr("app.core.otel.FastAPIInstrumentor", mock_fastapi_intr)
-    monkeypatch.setattr("app.core.otel.CeleryInstrumentor", mock_celery_intr)
-    monkeypatch.setattr("app.core.otel.set_logger_provider", MagicMock())
-    monkeypatch.setattr("app.core.otel.set_tracer_provider", MagicMock())
-    monkeypatch.setattr("app.core.otel.set_meter_provider", MagicMock())
+    monkeypatch.setattr("opentelemetry.instrumentation.asyncio.AsyncioInstrumentor", mock_asyncio_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.logging.LoggingInstrumentor", mock_logging_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.sqlalchemy.SQLAlchemyInstrumentor", mock_sqlalchemy_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", mock_fastapi_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.celery.CeleryInstrumentor", mock_celery_intr)
+    monkeypatch.setattr("opentelemetry._logs.set_logger_provider", MagicMock())
+    monkeypatch.setattr("opentelemetry.trace.set_tracer_provider", MagicMock())
+    monkeypatch.setattr("opentelemetry.metrics.set_meter_provider", MagicMock())
 
     app = FastAPI()
     setup_open_telemetry(app, db_engine_fixture, Settings(otel_enabled=True))
@@ -58,14 +60,14 @@ def test_setup_open_telemetry_instruments_celery_dependencies_when_enabled(
     mock_fastapi_intr = MagicMock()
     mock_celery_intr = MagicMock()
 
-    monkeypatch.setattr("app.core.otel.AsyncioInstrumentor", mock_asyncio_intr)
-    monkeypatch.setattr("app.core.otel.LoggingInstrumentor", mock_logging_intr)
-    monkeypatch.setattr("app.core.otel.SQLAlchemyInstrumentor", mock_sqlalchemy_intr)
-    monkeypatch.setattr("app.core.otel.FastAPIInstrumentor", mock_fastapi_intr)
-    monkeypatch.setattr("app.core.otel.CeleryInstrumentor", mock_celery_intr)
-    monkeypatch.setattr("app.core.otel.set_logger_provider", MagicMock())
-    monkeypatch.setattr("app.core.otel.set_tracer_provider", MagicMock())
-    monkeypatch.setattr("app.core.otel.set_meter_provider", MagicMock())
+    monkeypatch.setattr("opentelemetry.instrumentation.asyncio.AsyncioInstrumentor", mock_asyncio_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.logging.LoggingInstrumentor", mock_logging_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.sqlalchemy.SQLAlchemyInstrumentor", mock_sqlalchemy_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor", mock_fastapi_intr)
+    monkeypatch.setattr("opentelemetry.instrumentation.celery.CeleryInstrumentor", mock_celery_intr)
+    monkeypatch.setattr("opentelemetry._logs.set_logger_provider", MagicMock())
+    monkeypatch.setattr("opentelemetry.trace.set_tracer_provider", MagicMock())
+    monkeypatch.setattr("opentelemetry.metrics.set_meter_provider", MagicMock())
 
     app = Celery()
     setup_open_telemetry(app, db_engine_fixture, Settings(otel_enabled=True))
@@ -77,3 +79,65 @@ def test_setup_open_telemetry_instruments_celery_dependencies_when_enabled(
     )
     mock_fastapi_intr.instrument_app.assert_not_called()
     mock_celery_intr().instrument.assert_called_once()
+
+
+def test_shutdown_open_telemetry_skips_providers_when_disabled(monkeypatch: MonkeyPatch):
+    mock_get_tracer_provider = MagicMock()
+    monkeypatch.setattr("opentelemetry.trace.get_tracer_provider", mock_get_tracer_provider)
+
+    shutdown_open_telemetry(Settings(otel_enabled=False))
+    mock_get_tracer_provider.assert_not_called()
+
+
+def test_shutdown_open_telemetry_shuts_down_sdk_providers_when_enabled(monkeypatch: MonkeyPatch):
+    from opentelemetry.sdk._logs import LoggerProvider
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.trace import TracerProvider
+
+    tracer_provider = MagicMock(spec=TracerProvider)
+    meter_provider = MagicMock(spec=MeterProvider)
+    logger_provider = MagicMock(spec=LoggerProvider)
+    monkeypatch.setattr("opentelemetry.trace.get_tracer_provider", lambda: tracer_provider)
+    monkeypatch.setattr("opentelemetry.metrics.get_meter_provider", lambda: meter_provider)
+    monkeypatch.setattr("opentelemetry._logs.get_logger_provider", lambda: logger_provider)
+
+    shutdown_open_telemetry(Settings(otel_enabled=True))
+
+    tracer_provider.shutdown.assert_called_once()
+    meter_provider.shutdown.assert_called_once()
+    logger_provider.shutdown.assert_called_once()
+
+
+def test_create_celery_app_replaces_the_worker_process_init_receiver(
+    settings_fixture: Settings, monkeypatch: MonkeyPatch
+):
+    mock_create_db_engine = MagicMock()
+    mock_setup_open_telemetry = MagicMock()
+    monkeypatch.setattr("app.celery.create_db_engine_from_settings", mock_create_db_engine)
+    monkeypatch.setattr("app.celery.setup_open_telemetry", mock_setup_open_telemetry)
+
+    first_settings = settings_fixture.model_copy(update={"celery_timezone": "UTC"})
+    second_settings = settings_fixture.model_copy(update={"celery_timezone": "Asia/Colombo"})
+    _ = create_celery_app(first_settings)
+    second_app = create_celery_app(second_settings)
+
+    _ = worker_process_init.send(sender=None)
+
+    mock_create_db_engine.assert_called_once_with(second_settings)
+    mock_setup_open_telemetry.assert_called_once_with(second_app, mock_create_db_engine(), second_settings)
+
+
+def test_create_celery_app_replaces_the_worker_process_shutdown_receiver(
+    settings_fixture: Settings, monkeypatch: MonkeyPatch
+):
+    mock_shutdown_open_telemetry = MagicMock()
+    monkeypatch.setattr("app.celery.shutdown_open_telemetry", mock_shutdown_open_telemetry)
+
+    first_settings = settings_fixture.model_copy(update={"celery_timezone": "UTC"})
+    second_settings = settings_fixture.model_copy(update={"celery_timezone": "Asia/Colombo"})
+    _ = create_celery_app(first_settings)
+    _ = create_celery_app(second_settings)
+
+    _ = worker_process_shutdown.send(sender=None)
+
+    mock_shutdown_open_telemetry.assert_called_once_with(second_settings)
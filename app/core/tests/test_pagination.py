@@ -0,0 +1,58 @@
+import base64
+from datetime import datetime, timezone
+from typing import Any
+import uuid
+
+import pytest
+from sqlalchemy import Executable, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import count_total, decode_cursor, encode_cursor
+from app.features.users.models.user import User
+from app.fixtures.user_factory import UserFactory
+
+
+def test_cursor_round_trips_position():
+    sort_value = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor("created_at", sort_value, row_id), "created_at") == (sort_value, row_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b"created_at|2026-01-02T03:04:05+00:00").decode(),
+        base64.urlsafe_b64encode(f"created_at|2026-01-02T03:04:05|{uuid.uuid4()}".encode()).decode(),
+        base64.urlsafe_b64encode(b"created_at|2026-01-02T03:04:05+00:00|not-a-uuid").decode(),
+    ],
+)
+def test_decode_cursor_rejects_malformed_cursors(cursor: str):
+    with pytest.raises(ValueError):
+        _ = decode_cursor(cursor, "created_at")
+
+
+def test_decode_cursor_rejects_cursors_for_another_sort_column():
+    cursor = encode_cursor("created_at", datetime(2026, 1, 2, tzinfo=timezone.utc), uuid.uuid4())
+    with pytest.raises(ValueError):
+        _ = decode_cursor(cursor, "updated_at")
+
+
+@pytest.mark.asyncio
+async def test_count_total_ignores_ordering(db_fixture: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    db_fixture.add_all(UserFactory.build_batch(3))
+    await db_fixture.flush()
+
+    executed: list[Executable] = []
+    execute = db_fixture.execute
+
+    async def spy_execute(statement: Executable, *args: Any, **kwargs: Any):
+        executed.append(statement)
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_fixture, "execute", spy_execute)
+
+    stmt = select(User).order_by(User.created_at.desc())
+    assert await count_total(db_fixture, stmt) == 3
+    assert len(executed) == 1
+    assert "ORDER BY" not in str(executed[0])
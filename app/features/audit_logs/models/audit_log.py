@@ -3,12 +3,12 @@ import uuid
 from datetime import datetime
 
 
-from sqlalchemy import String, JSON, ForeignKey, UUID
+from sqlalchemy import String, ForeignKey, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import Enum
 
 
-from app.core.database import Base
+from app.core.database import JSONB, Base
 from app.core.timezone import DateTimeUTC, utc_now
 
 
@@ -24,14 +24,14 @@ class AuditLog(Base):
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
 
     actor_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
-    actor_type: Mapped[ActorType] = mapped_column(Enum(ActorType))
+    actor_type: Mapped[ActorType] = mapped_column(Enum(ActorType, native_enum=False, length=32, create_constraint=True))
     action: Mapped[str] = mapped_column(String)
     resource_type: Mapped[str] = mapped_column(String)
     resource_id: Mapped[uuid.UUID] = mapped_column(UUID)
 
-    old_value: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
-    new_value: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
-    changed_value: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
+    old_value: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+    new_value: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+    changed_value: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
 
     trace_id: Mapped[str | None] = mapped_column(String, nullable=True)
     request_ip_address: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -3,11 +3,11 @@ import uuid
 import enum
 import typing
 
-from app.core.database import Base
+from app.core.database import JSONB, Base
 
 from sqlalchemy.types import Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import UUID, JSON, ForeignKey
+from sqlalchemy import UUID, ForeignKey
 
 from app.core.timezone import DateTimeUTC, utc_now
 
@@ -31,8 +31,10 @@ class Notification(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
-    type: Mapped[NotificationType] = mapped_column(Enum(NotificationType))
-    data: Mapped[dict[str, object]] = mapped_column(JSON, default=dict)
+    type: Mapped[NotificationType] = mapped_column(
+        Enum(NotificationType, native_enum=False, length=32, create_constraint=True)
+    )
+    data: Mapped[dict[str, object]] = mapped_column(JSONB, default=dict)
 
     created_at: Mapped[datetime] = mapped_column(DateTimeUTC, default=utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTimeUTC, default=utc_now, onupdate=utc_now)
@@ -7,7 +7,7 @@ from app.core.database import Base
 
 from sqlalchemy.types import Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import UUID, String, ForeignKey
+from sqlalchemy import UUID, Index, String, ForeignKey
 
 from app.core.timezone import DateTimeUTC, utc_now
 
@@ -36,16 +36,30 @@ class NotificationStatus(enum.Enum):
 
 class NotificationDelivery(Base):
     __tablename__ = "notification_delivery"
+    # Every lookup joins deliveries to their notification and filters on channel and status. On PostgreSQL those
+    # columns are carried in the index leaf pages, so the join filter is answered without visiting the heap.
+    __table_args__ = (
+        Index(
+            "ix_notification_delivery_notification_id",
+            "notification_id",
+            postgresql_include=["channel", "status"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
     notification_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("notifications.id", ondelete="CASCADE"))
-    channel: Mapped[NotificationChannel] = mapped_column(Enum(NotificationChannel))
+    channel: Mapped[NotificationChannel] = mapped_column(
+        Enum(NotificationChannel, native_enum=False, length=32, create_constraint=True)
+    )
 
     recipient: Mapped[str] = mapped_column(String)
     title: Mapped[str | None] = mapped_column(String, nullable=True)
     body: Mapped[str] = mapped_column(String)
 
-    status: Mapped[NotificationStatus] = mapped_column(Enum(NotificationStatus), default=NotificationStatus.PENDING)
+    status: Mapped[NotificationStatus] = mapped_column(
+        Enum(NotificationStatus, native_enum=False, length=32, create_constraint=True),
+        default=NotificationStatus.PENDING,
+    )
     failure_message: Mapped[str | None] = mapped_column(String, nullable=True)
     provider_ref: Mapped[str | None] = mapped_column(String, nullable=True)
     sent_at: Mapped[datetime | None] = mapped_column(DateTimeUTC, nullable=True)
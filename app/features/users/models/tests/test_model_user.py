@@ -1,6 +1,10 @@
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
 
-from app.features.users.models.user import User, UserType
+from app.features.users.models.user import User, UserType, user_search_text
 from app.fixtures.user_factory import UserFactory
 
 
@@ -36,3 +40,46 @@ def test_oauth2_scopes_for_customer():
 def test_oauth2_scopes_for_unknown_type():
     user: User = UserFactory.build(type=None)
     assert user.get_oauth2_scopes() == {"user"}
+
+
+def test_check_dummy_password_always_returns_false():
+    assert not User.check_dummy_password("dummy-password")
+    assert not User.check_dummy_password("AnyOtherPassword!")
+
+
+@pytest.mark.asyncio
+async def test_user_ids_default_to_time_ordered_uuid7(db_fixture: AsyncSession):
+    first_user: User = UserFactory.build()
+    second_user: User = UserFactory.build()
+    db_fixture.add(first_user)
+    await db_fixture.flush()
+    db_fixture.add(second_user)
+    await db_fixture.flush()
+
+    assert first_user.id.version == 7
+    assert first_user.id < second_user.id
+
+
+@pytest.mark.asyncio
+async def test_user_relationships_raise_instead_of_lazy_loading(db_fixture: AsyncSession):
+    user: User = UserFactory.build()
+    db_fixture.add(user)
+    await db_fixture.flush()
+    db_fixture.expunge_all()
+
+    loaded_user = await db_fixture.get_one(User, user.id)
+    with pytest.raises(InvalidRequestError):
+        _ = loaded_user.actions
+    with pytest.raises(InvalidRequestError):
+        _ = loaded_user.notifications
+
+
+def test_user_type_is_stored_as_varchar_with_check_constraint():
+    ddl = str(CreateTable(User.__table__).compile(dialect=postgresql.dialect()))  # pyright: ignore[reportArgumentType]
+    assert "type VARCHAR(32) NOT NULL" in ddl
+    assert "CONSTRAINT usertype CHECK (type IN ('ADMIN', 'CUSTOMER'))" in ddl
+
+
+def test_user_search_text_matches_the_trigram_index_expression():
+    sql = str(user_search_text.compile(dialect=postgresql.dialect()))
+    assert sql == "lower(users.username || ' ' || users.first_name || ' ' || users.last_name)"
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
 import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
 
 from app.features.users.models.user_action import UserAction, UserActionState
 from app.fixtures.user_action_factory import UserActionFactory
@@ -37,3 +39,10 @@ async def test_is_valid_returns_false_for_non_pending_state():
     raw_token = "SecurePassword123!"
     user.set_token(raw_token)
     assert not user.is_valid(raw_token)
+
+
+def test_user_action_data_is_stored_as_jsonb_on_postgresql():
+    postgresql_ddl = str(CreateTable(UserAction.__table__).compile(dialect=postgresql.dialect()))  # pyright: ignore[reportArgumentType]
+    sqlite_ddl = str(CreateTable(UserAction.__table__).compile(dialect=sqlite.dialect()))  # pyright: ignore[reportArgumentType]
+    assert "data JSONB" in postgresql_ddl
+    assert "data JSON" in sqlite_ddl
@@ -1,5 +1,6 @@
 from datetime import datetime
 import enum
+import functools
 import uuid
 import typing
 
@@ -11,7 +12,7 @@ from app.core.database import Base
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
-from sqlalchemy import UUID, Enum, String
+from sqlalchemy import UUID, Enum, Index, String, func, literal_column
 
 from app.core.timezone import DateTimeUTC, utc_now
 
@@ -26,6 +27,16 @@ if typing.TYPE_CHECKING:
 # ----------------------------------------------------------------------------------------------------------------------
 
 
+# Argon2 hasher shared by all users; it holds only the hashing parameters, so it is safe to reuse across threads.
+password_hasher = PasswordHasher()
+
+
+# Hash of a throwaway password, computed once and verified against when a login matches no user.
+@functools.cache
+def _dummy_password_hash() -> str:
+    return password_hasher.hash("dummy-password")
+
+
 class UserType(enum.Enum):
     ADMIN = "admin"
     CUSTOMER = "customer"
@@ -33,9 +44,17 @@ class UserType(enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    # Composite indexes backing keyset pagination of the admin user list in either sort order.
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_updated_at_id", "updated_at", "id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
-    type: Mapped[UserType] = mapped_column(Enum(UserType))
+    # Time-ordered UUIDv7 ids keep new rows at the tail of the primary key index instead of random pages.
+    id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid7)
+    # Enums are stored as VARCHAR + CHECK rather than native PostgreSQL enum types, so asyncpg does not need to
+    # introspect pg_type on every new connection before it can decode the column.
+    type: Mapped[UserType] = mapped_column(Enum(UserType, native_enum=False, length=32, create_constraint=True))
     username: Mapped[str] = mapped_column(String, unique=True)
 
     # This system follows the pattern of emails being unique but optional.
@@ -70,17 +89,31 @@ class User(Base):
     )
 
     def set_password(self, password: str):
-        password_hasher = PasswordHasher()
+        """
+        Hash and set the password. Hashing is deliberately slow,
+        so call this through `asyncio.to_thread` from request handlers.
+        """
         self.hashed_password = password_hasher.hash(password)
         self.password_set_at = utc_now()
 
     def check_password(self, password: str) -> bool:
-        password_hasher = PasswordHasher()
         try:
             return password_hasher.verify(self.hashed_password, password)
         except Argon2Error:
             return False
 
+    @staticmethod
+    def check_dummy_password(password: str) -> bool:
+        """
+        Verify the password against a throwaway hash and always return False.
+        Call this when no user matches, so unknown usernames take as long to reject as wrong passwords.
+        """
+        try:
+            _ = password_hasher.verify(_dummy_password_hash(), password)
+        except Argon2Error:
+            pass
+        return False
+
     def get_oauth2_scopes(self) -> set[str]:
         """Return the OAuth2 scopes associated with this user based on their type."""
         if self.type == UserType.ADMIN:
@@ -89,3 +122,17 @@ class User(Base):
             return {"customer", "user"}
         else:
             return {"user"}
+
+
+# Lowercased text matched by the admin user list search.
+# On PostgreSQL it is backed by a pg_trgm GIN index, so `%term%` searches do not need a sequential scan.
+# The separators are literal SQL rather than bind parameters, so queries render the exact indexed expression and
+# the index also matches under generic prepared plans.
+_separator = literal_column("' '")
+user_search_text = func.lower(User.username + _separator + User.first_name + _separator + User.last_name)
+_ = Index(
+    "ix_users_search_trgm",
+    user_search_text.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
@@ -6,11 +6,11 @@ import typing
 from argon2 import PasswordHasher
 from argon2.exceptions import Argon2Error
 
-from app.core.database import Base
+from app.core.database import JSONB, Base
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
-from sqlalchemy import JSON, UUID, Enum, ForeignKey, String
+from sqlalchemy import UUID, Enum, ForeignKey, String
 
 from app.core.timezone import DateTimeUTC, utc_now
 
@@ -38,11 +38,15 @@ class UserAction(Base):
     __tablename__ = "user_actions"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
-    type: Mapped[UserActionType] = mapped_column(Enum(UserActionType))
-    state: Mapped[UserActionState] = mapped_column(Enum(UserActionState), default=UserActionState.PENDING)
+    type: Mapped[UserActionType] = mapped_column(
+        Enum(UserActionType, native_enum=False, length=32, create_constraint=True)
+    )
+    state: Mapped[UserActionState] = mapped_column(
+        Enum(UserActionState, native_enum=False, length=32, create_constraint=True), default=UserActionState.PENDING
+    )
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
 
-    data: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
+    data: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
     hashed_token: Mapped[str] = mapped_column(String)
 
     expires_at: Mapped[datetime] = mapped_column(DateTimeUTC)
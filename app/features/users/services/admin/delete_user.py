@@ -1,9 +1,9 @@
 import uuid
 from fastapi import APIRouter, status
-from sqlalchemy import select
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.auth import AuthenticationFailedException, AuthorizationFailedException, CurrentAdminDep
+from app.core.cache import CacheDep
 from app.core.database import DbDep
 from app.core.exceptions import ServiceException, raises
 from app.features.users.models.user import User
@@ -30,19 +30,20 @@ class UserNotFoundException(ServiceException):
 @raises(UserNotFoundException)
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
-    user_id: uuid.UUID, db: DbDep, current_user: CurrentAdminDep, audit_logger: AuditLoggerDep
+    user_id: uuid.UUID, db: DbDep, current_user: CurrentAdminDep, audit_logger: AuditLoggerDep, cache: CacheDep
 ) -> None:
     """
     Delete a user from the system.
     The authenticated user must be an admin.
     """
     # Fetch user from database
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
     if user is None:
         raise UserNotFoundException()
 
     await audit_logger.record("delete", user)
     await db.delete(user)
     await db.commit()
+
+    # Drop the user detail endpoint's cached response for this user
+    await cache.vary("user", str(user_id)).invalidate()
@@ -55,20 +55,33 @@ async def detail_user(
     The authenticated user must be an admin.
 
     This endpoint is cached for demonstration purposes.
+    The cached response is shared by all admins and invalidated when the user is updated or deleted.
     """
-    # Check and return from cache
-    response_cache = cache.vary_on_path().vary_on_auth().with_ttl(60).build(UserDetailOutput)
+    # Check and return from cache, keyed by the user rather than the viewer since all admins see the same details.
+    # The key uses the parsed id, so any spelling of it in the path (e.g. uppercase) shares one entry.
+    response_cache = cache.vary("user", str(user_id)).with_ttl(60).build(UserDetailOutput)
     if cache_result := await response_cache.get():
         return cache_result
 
-    # Fetch user from database
-    stmt = select(User).where(User.id == user_id)
+    # Fetch user from database, selecting only the columns the output needs
+    stmt = select(
+        User.id,
+        User.type,
+        User.username,
+        User.first_name,
+        User.last_name,
+        User.email,
+        User.joined_at,
+        User.created_at,
+        User.updated_at,
+    ).where(User.id == user_id)
     result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = result.one_or_none()
     if user is None:
         raise UserNotFoundException()
 
-    response = UserDetailOutput(
+    # Every field is a column of the loaded user, already typed by the ORM, so validation is skipped
+    response = UserDetailOutput.model_construct(
         id=user.id,
         type=user.type,
         username=user.username,
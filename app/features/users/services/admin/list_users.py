@@ -1,16 +1,18 @@
+from datetime import datetime
 from typing import Annotated, Literal
 import uuid
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.core.auth import AuthenticationFailedException, AuthorizationFailedException, CurrentAdminDep
 from app.core.cache import CacheDep
 from app.core.database import DbDep
-from app.core.exceptions import raises
-from app.core.pagination import Page, paginate
-from app.core.rate_limit import RateLimitExceededException, rate_limit
-from app.features.users.models.user import UserType, User
+from app.core.exceptions import ServiceException, raises
+from app.core.pagination import CursorPage, decode_cursor, paginate_keyset_rows
+from app.core.rate_limit import RateLimitDep, RateLimitExceededException
+from app.features.users.models.user import UserType, User, user_search_text
 
 
 router = APIRouter()
@@ -22,7 +24,7 @@ router = APIRouter()
 class UserFilterInput(BaseModel):
     search: str | None = None
     limit: int = Field(100, gt=0, le=100)
-    offset: int = Field(0, ge=0)
+    cursor: str | None = None
     order_by: Literal["created_at", "updated_at"] = "created_at"
 
 
@@ -34,54 +36,88 @@ class UserListOutput(BaseModel):
     last_name: str
 
 
+def user_list_output(row: Row[tuple[uuid.UUID, UserType, str, str, str, datetime]]) -> UserListOutput:
+    """Builds the list output for a user row; values come straight from the database, so they are not re-validated."""
+    return UserListOutput.model_construct(
+        id=row.id,
+        type=row.type,
+        username=row.username,
+        first_name=row.first_name,
+        last_name=row.last_name,
+    )
+
+
+# Columns the list can be ordered by; each is paired with the id in a composite index for keyset pagination.
+user_list_order_columns: dict[str, InstrumentedAttribute[datetime]] = {
+    "created_at": User.created_at,
+    "updated_at": User.updated_at,
+}
+
+
+# Exceptions
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+class InvalidCursorException(ServiceException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    type = "users/admin/list-users/invalid-cursor"
+    detail = "Invalid pagination cursor"
+
+
 # User list endpoint
 # ----------------------------------------------------------------------------------------------------------------------
 
 
 @raises(AuthenticationFailedException)
 @raises(AuthorizationFailedException)
+@raises(InvalidCursorException)
 @raises(RateLimitExceededException)
 @router.get("/")
-@rate_limit("10/minute")
 async def list_users(
     db: DbDep,
     query: Annotated[UserFilterInput, Query()],
     current_user: CurrentAdminDep,
     cache: CacheDep,
-) -> Page[UserListOutput]:
+    rate_limit: RateLimitDep,
+) -> CursorPage[UserListOutput]:
     """
     List users in the system with optional search and pagination.
     The authenticated user must be an admin.
 
+    Pagination is cursor based: pass the `next_cursor` of a page as `cursor` to fetch the following page.
+    Cursors are only valid for the `order_by` they were issued with; any other cursor is rejected as invalid.
+    This replaced offset pagination: the `offset` parameter is no longer read and the response has no `count`.
+
     This endpoint is rate-limited and cached for demonstration purposes.
+    Responses served from cache do not count towards the rate limit.
     """
     # Check and return from cache
-    response_cache = cache.vary_on_path().vary_on_query().vary_on_auth().with_ttl(60).build(Page[UserListOutput])
+    response_cache = cache.vary_on("path", "query", "auth").with_ttl(60).build(CursorPage[UserListOutput])
     if cache_result := await response_cache.get():
         return cache_result
 
-    # Build query with filters
-    stmt = select(User)
+    # Only cache misses reach the database, so only they are rate limited
+    await rate_limit.limit("10/minute")
+
+    # Build query with filters, selecting only the columns the output needs (and the column to order by)
+    order_column = user_list_order_columns[query.order_by]
+    stmt = select(User.id, User.type, User.username, User.first_name, User.last_name, order_column)
     if query.search:
-        search_pattern = f"%{query.search}%"
-        stmt = stmt.where(
-            User.username.ilike(search_pattern)
-            | User.first_name.ilike(search_pattern)
-            | User.last_name.ilike(search_pattern)
-        )
-
-    # Apply ordering, pagination, and execute
-    order_column = User.created_at if query.order_by == "created_at" else User.updated_at
-    stmt = stmt.order_by(order_column)
-    result = await paginate(db, stmt, limit=query.limit, offset=query.offset)
-    response = result.map_to(
-        lambda user: UserListOutput(
-            id=user.id,
-            type=user.type,
-            username=user.username,
-            first_name=user.first_name,
-            last_name=user.last_name,
-        )
+        # Single expression matching the trigram index, instead of one ILIKE per column.
+        # The pattern is lowered in SQL like the column, so both sides fold case the same way on every dialect.
+        stmt = stmt.where(user_search_text.like(func.lower(f"%{query.search}%")))
+
+    # Decode the cursor on its own, so only a malformed cursor (or one issued for another ordering) is reported as one
+    after = None
+    if query.cursor is not None:
+        try:
+            after = decode_cursor(query.cursor, order_column.key)
+        except ValueError as e:
+            raise InvalidCursorException() from e
+
+    # Apply keyset ordering and pagination, and execute
+    response = await paginate_keyset_rows(
+        db, stmt, user_list_output, order_column, User.id, after=after, limit=query.limit
     )
 
     return await response_cache.set(response)
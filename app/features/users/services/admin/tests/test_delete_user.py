@@ -3,6 +3,7 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.testclient import TestClient
+from app.features.audit_logs.models.audit_log import AuditLog
 from app.features.users.models.user import UserType, User
 from app.fixtures.user_factory import UserFactory
 
@@ -29,6 +30,51 @@ async def test_admin_can_delete_other_user_account(
     assert deleted_user is None
 
 
+@pytest.mark.asyncio
+async def test_admin_delete_user_records_deleted_values_in_audit_log(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    user1: User = UserFactory.build(password__raw="userpassword")
+    db_fixture.add(user1)
+    await db_fixture.commit()
+    await db_fixture.refresh(user1)
+    user_id, username = user1.id, user1.username
+
+    response = test_client_fixture.delete(f"{BASE_URL}/{user_id}")
+    assert response.status_code == 204
+
+    stmt = select(AuditLog).where(AuditLog.resource_id == user_id, AuditLog.action == "delete")
+    result = await db_fixture.execute(stmt)
+    audit_log = result.scalar_one()
+    assert audit_log.new_value is None
+    assert audit_log.old_value is not None
+    assert audit_log.old_value["username"] == username
+    assert "hashed_password" not in audit_log.old_value
+
+
+@pytest.mark.asyncio
+async def test_admin_delete_invalidates_cached_user_detail(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    user1: User = UserFactory.build(password__raw="userpassword")
+    db_fixture.add(user1)
+    await db_fixture.commit()
+    await db_fixture.refresh(user1)
+    user_id = user1.id
+
+    # The detail is read with an uppercase id, while the write below uses the canonical form
+    response = test_client_fixture.get(f"{BASE_URL}/{str(user_id).upper()}")
+    assert response.status_code == 200
+
+    response = test_client_fixture.delete(f"{BASE_URL}/{user_id}")
+    assert response.status_code == 204
+
+    response = test_client_fixture.get(f"{BASE_URL}/{str(user_id).upper()}")
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_admin_cannot_delete_nonexistent_user(test_client_fixture: TestClient, authenticated_admin_fixture: User):
     assert authenticated_admin_fixture.type == UserType.ADMIN
@@ -27,14 +27,76 @@ async def test_admin_can_list_users_with_pagination(
     test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
 ):
     assert authenticated_admin_fixture.type == UserType.ADMIN
+    admin_username = authenticated_admin_fixture.username
 
     await create_users(db_fixture)
 
-    response = test_client_fixture.get(f"{BASE_URL}/?limit=2&offset=0")
+    response = test_client_fixture.get(f"{BASE_URL}/?limit=3")
     assert response.status_code == 200
-    data = response.json()
-    assert data["count"] == 4  # Including the logged-in admin
-    assert len(data["items"]) == 2
+    first_page = response.json()
+    assert len(first_page["items"]) == 3
+    assert first_page["next_cursor"] is not None
+
+    response = test_client_fixture.get(f"{BASE_URL}/?limit=3&cursor={first_page['next_cursor']}")
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page["items"]) == 1  # 4 users including the logged-in admin
+    assert second_page["next_cursor"] is None
+
+    usernames = [item["username"] for item in first_page["items"] + second_page["items"]]
+    assert sorted(usernames) == sorted(["alice", "bob", "charlie", admin_username])
+
+
+@pytest.mark.asyncio
+async def test_admin_can_page_users_ordered_by_update_time(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    await create_users(db_fixture)
+
+    response = test_client_fixture.get(f"{BASE_URL}/?order_by=updated_at&limit=2")
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+
+    cursor = first_page["next_cursor"]
+    response = test_client_fixture.get(f"{BASE_URL}/?order_by=updated_at&limit=2&cursor={cursor}")
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page["items"]) == 2
+    assert second_page["next_cursor"] is None
+
+    first_ids = {item["id"] for item in first_page["items"]}
+    assert first_ids.isdisjoint(item["id"] for item in second_page["items"])
+
+
+@pytest.mark.asyncio
+async def test_admin_list_users_rejects_invalid_cursor(
+    test_client_fixture: TestClient, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    response = test_client_fixture.get(f"{BASE_URL}/?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["type"] == "users/admin/list-users/invalid-cursor"
+
+
+@pytest.mark.asyncio
+async def test_admin_list_users_rejects_cursor_issued_for_another_ordering(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    await create_users(db_fixture)
+
+    response = test_client_fixture.get(f"{BASE_URL}/?order_by=created_at&limit=2")
+    assert response.status_code == 200
+    cursor = response.json()["next_cursor"]
+
+    response = test_client_fixture.get(f"{BASE_URL}/?order_by=updated_at&limit=2&cursor={cursor}")
+    assert response.status_code == 400
+    assert response.json()["type"] == "users/admin/list-users/invalid-cursor"
 
 
 @pytest.mark.asyncio
@@ -48,5 +110,60 @@ async def test_admin_can_list_users_with_search(
     response = test_client_fixture.get(f"{BASE_URL}/?search=Bob")
     assert response.status_code == 200
     data = response.json()
-    assert data["count"] == 1
+    assert len(data["items"]) == 1
     assert data["items"][0]["username"] == "bob"
+
+
+@pytest.mark.asyncio
+async def test_admin_can_search_users_across_name_columns_case_insensitively(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    await create_users(db_fixture)
+
+    response = test_client_fixture.get(f"{BASE_URL}/?search=charlie CLARK")
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["username"] for item in data["items"]] == ["charlie"]
+
+
+@pytest.mark.asyncio
+async def test_admin_can_search_users_with_non_ascii_names(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    db_fixture.add(UserFactory.build(username="elodie", first_name="Élodie", last_name="Dupont"))
+    await db_fixture.commit()
+
+    response = test_client_fixture.get(f"{BASE_URL}/", params={"search": "Élodie"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["username"] for item in data["items"]] == ["elodie"]
+
+
+@pytest.mark.asyncio
+async def test_admin_cached_list_users_responses_are_not_rate_limited(
+    test_client_fixture: TestClient, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    for _ in range(15):
+        response = test_client_fixture.get(f"{BASE_URL}/?search=alice")
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_admin_list_users_is_rate_limited_on_cache_misses(
+    test_client_fixture: TestClient, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    for limit in range(1, 11):
+        response = test_client_fixture.get(f"{BASE_URL}/?limit={limit}")
+        assert response.status_code == 200
+
+    response = test_client_fixture.get(f"{BASE_URL}/?limit=11")
+    assert response.status_code == 429
+    assert response.json()["type"] == "rate-limit/exceeded"
@@ -19,22 +19,49 @@ async def test_admin_can_update_other_user_profile(
     db_fixture.add_all([user1])
     await db_fixture.commit()
     await db_fixture.refresh(user1)
+    user_id = user1.id
 
     payload = {"first_name": "NewFirst", "last_name": "NewLast"}
-    response = test_client_fixture.put(f"{BASE_URL}/{user1.id}", json=payload)
+    response = test_client_fixture.put(f"{BASE_URL}/{user_id}", json=payload)
     assert response.status_code == 200
 
     data = response.json()
     assert data["first_name"] == "NewFirst"
     assert data["last_name"] == "NewLast"
 
-    stmt = select(User).where(User.id == user1.id)
+    stmt = select(User).where(User.id == user_id)
     result = await db_fixture.execute(stmt)
     updated_user = result.scalar_one()
     assert updated_user.first_name == "NewFirst"
     assert updated_user.last_name == "NewLast"
 
 
+@pytest.mark.asyncio
+async def test_admin_update_invalidates_cached_user_detail(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    user1: User = UserFactory.build(password__raw="userpassword", first_name="OldFirst", last_name="OldLast")
+    db_fixture.add(user1)
+    await db_fixture.commit()
+    await db_fixture.refresh(user1)
+    user_id = user1.id
+
+    # The detail is read with an uppercase id, while the write below uses the canonical form
+    response = test_client_fixture.get(f"{BASE_URL}/{str(user_id).upper()}")
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "OldFirst"
+
+    payload = {"first_name": "NewFirst", "last_name": "NewLast"}
+    response = test_client_fixture.put(f"{BASE_URL}/{user_id}", json=payload)
+    assert response.status_code == 200
+
+    response = test_client_fixture.get(f"{BASE_URL}/{str(user_id).upper()}")
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "NewFirst"
+
+
 @pytest.mark.asyncio
 async def test_admin_cannot_update_nonexistent_user_profile(
     test_client_fixture: TestClient, authenticated_admin_fixture: User
@@ -64,3 +91,19 @@ async def test_admin_cannot_update_user_email_to_existing_email(
     response = test_client_fixture.put(f"{BASE_URL}/{user1.id}", json=payload)
     assert response.status_code == 400
     assert response.json()["type"] == "users/admin/update/email-exists"
+
+
+@pytest.mark.asyncio
+async def test_admin_cannot_update_nonexistent_user_even_if_email_exists(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticated_admin_fixture: User
+):
+    assert authenticated_admin_fixture.type == UserType.ADMIN
+
+    user1: User = UserFactory.build(password__raw="userpassword", email="user1@example.com")
+    db_fixture.add(user1)
+    await db_fixture.commit()
+
+    payload = {"first_name": "NewFirst", "last_name": "NewLast", "email": "user1@example.com"}
+    response = test_client_fixture.put(f"{BASE_URL}/{uuid.uuid4()}", json=payload)
+    assert response.status_code == 404
+    assert response.json()["type"] == "users/admin/update/user-not-found"
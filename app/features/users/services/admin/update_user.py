@@ -1,10 +1,11 @@
 import uuid
 from fastapi import APIRouter, status
-from pydantic import AwareDatetime, BaseModel, EmailStr, Field
-from sqlalchemy import select
+from pydantic import AwareDatetime, BaseModel, ConfigDict, EmailStr, Field
+from sqlalchemy import or_, select
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.auth import AuthenticationFailedException, AuthorizationFailedException, CurrentAdminDep
+from app.core.cache import CacheDep
 from app.core.database import DbDep
 from app.core.exceptions import ServiceException, raises
 from app.features.users.models.user import UserType, User
@@ -24,6 +25,8 @@ class UserUpdateInput(BaseModel):
 
 
 class UserUpdateOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: uuid.UUID
     type: UserType
     username: str
@@ -61,16 +64,24 @@ class EmailExistsException(ServiceException):
 @raises(EmailExistsException)
 @router.put("/{user_id}")
 async def update_user(
-    user_id: uuid.UUID, form: UserUpdateInput, db: DbDep, current_user: CurrentAdminDep, audit_logger: AuditLoggerDep
+    user_id: uuid.UUID,
+    form: UserUpdateInput,
+    db: DbDep,
+    current_user: CurrentAdminDep,
+    audit_logger: AuditLoggerDep,
+    cache: CacheDep,
 ) -> UserUpdateOutput:
     """
     Update a user's information.
     The authenticated user must be an admin.
     """
-    # Fetch user from database
+    # Fetch user from database, along with any other user already holding the requested email
     stmt = select(User).where(User.id == user_id)
+    if form.email is not None:
+        stmt = select(User).where(or_(User.id == user_id, User.email == form.email))
     result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    users = result.scalars().all()
+    user = next((u for u in users if u.id == user_id), None)
     if user is None:
         raise UserNotFoundException()
 
@@ -82,25 +93,17 @@ async def update_user(
 
     # If email is being updated, check for uniqueness and send verification email
     if form.email is not None and user.email != form.email:
-        email_stmt = select(User).where(User.email == form.email).where(User.id != user.id)
-        email_result = await db.execute(email_stmt)
-        email_user = email_result.scalar_one_or_none()
+        email_user = next((u for u in users if u.id != user.id and u.email == form.email), None)
         if email_user is not None:
             raise EmailExistsException()
 
-    # Finalize update
+    # Finalize update, building the response before commit expires the user so no refresh is needed
     await audit_logger.record("update", user)
+    await db.flush()
+    response = UserUpdateOutput.model_validate(user)
     await db.commit()
-    await db.refresh(user)
-
-    return UserUpdateOutput(
-        id=user.id,
-        type=user.type,
-        username=user.username,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        email=user.email,
-        joined_at=user.joined_at,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+
+    # Drop the user detail endpoint's cached response for this user
+    await cache.vary("user", str(user_id)).invalidate()
+
+    return response
@@ -1,7 +1,7 @@
+import asyncio
 import logging
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.auth import AuthenticationFailedException, CurrentUserDep
@@ -66,20 +66,19 @@ async def change_password(
     Previously issued refresh tokens will be invalidated.
     """
     # Fetch the current user from the database
-    stmt = select(User).where(User.id == current_user.id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(User, current_user.id)
     if user is None:
         raise UserNotFoundException()
 
     # Verify old password and check new password validity
-    if not user.check_password(form.old_password):
+    # Hashing runs in a worker thread so the event loop keeps serving other requests
+    if not await asyncio.to_thread(user.check_password, form.old_password):
         raise PasswordIncorrectException()
     if form.old_password == form.new_password:
         raise PasswordsIdenticalException()
 
     # Update the user's password
-    user.set_password(form.new_password)
+    await asyncio.to_thread(user.set_password, form.new_password)
     await audit_logger.record("change_password", user)
     await db.commit()
 
@@ -1,7 +1,6 @@
 import logging
 from fastapi import APIRouter, UploadFile, status
 from pydantic import BaseModel
-from sqlalchemy import select
 
 from app.core.auth import AuthenticationFailedException, CurrentUserDep
 from app.core.database import DbDep
@@ -45,9 +44,7 @@ async def change_profile_picture(
     Change the profile picture for the current user.
     """
     # Fetch the current user from the database
-    stmt = select(User).where(User.id == current_user.id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(User, current_user.id)
     if user is None:
         raise UserNotFoundException()
 
@@ -1,5 +1,4 @@
 from fastapi import APIRouter, status
-from sqlalchemy import select
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.auth import AuthenticationFailedException, CurrentUserDep
@@ -30,9 +29,7 @@ class UserNotFoundException(ServiceException):
 async def delete_me(db: DbDep, current_user: CurrentUserDep, audit_logger: AuditLoggerDep) -> None:
     """Delete the currently authenticated user."""
     # Fetch user from database
-    stmt = select(User).where(User.id == current_user.id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(User, current_user.id)
     if user is None:
         raise UserNotFoundException()
 
@@ -1,7 +1,6 @@
 import uuid
 from fastapi import APIRouter, status
 from pydantic import AwareDatetime, BaseModel, EmailStr, HttpUrl
-from sqlalchemy import select
 
 from app.core.auth import AuthenticationFailedException, CurrentUserDep
 from app.core.database import DbDep
@@ -50,13 +49,12 @@ class UserNotFoundException(ServiceException):
 async def detail_me(db: DbDep, current_user: CurrentUserDep, storage: StorageDep) -> DetailMeOutput:
     """Get detailed information about the currently authenticated user."""
     # Fetch user from database
-    stmt = select(User).where(User.id == current_user.id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(User, current_user.id)
     if user is None:
         raise UserNotFoundException()
 
     profile_picture_url = storage.cdn_url(user.profile_picture)
+    # Built with validation so the storage URL (a plain string for remote backends) is coerced to HttpUrl
     return DetailMeOutput(
         id=user.id,
         type=user.type,
@@ -1,7 +1,8 @@
+import asyncio
 from typing import Annotated
 from fastapi import APIRouter, status, Form
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from app.core.auth import AuthenticatorDep
 from app.core.database import DbDep
@@ -11,6 +12,9 @@ from app.features.users.models.user import User
 
 router = APIRouter()
 
+# Built once at import, the statement is reused on every request with only the bound username changing.
+user_by_username_stmt = select(User).where(User.username == bindparam("username"))
+
 
 # Input/Output
 # ----------------------------------------------------------------------------------------------------------------------
@@ -46,14 +50,15 @@ class InvalidUsernameOrPasswordException(ServiceException):
 async def login_oauth2(
     form: Annotated[LoginInput, Form()], db: DbDep, authenticator: AuthenticatorDep
 ) -> OAuth2TokenResponse:
-    stmt = select(User).where(User.username == form.username)
-    result = await db.execute(stmt)
+    result = await db.execute(user_by_username_stmt, {"username": form.username})
     user = result.scalar_one_or_none()
     if user is None:
+        # Spend the same hashing work as a wrong password to avoid leaking usernames via timing
+        _ = await asyncio.to_thread(User.check_dummy_password, form.password)
         raise InvalidUsernameOrPasswordException()
 
-    # Verify password
-    password_valid = user.check_password(form.password)
+    # Verify password in a worker thread so the event loop keeps serving other requests during hashing
+    password_valid = await asyncio.to_thread(user.check_password, form.password)
     if not password_valid:
         raise InvalidUsernameOrPasswordException()
 
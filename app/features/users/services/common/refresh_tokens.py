@@ -1,7 +1,7 @@
 import uuid
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy.orm import load_only
 import logging
 
 from app.core.auth import AuthenticatorDep, AuthException
@@ -73,10 +73,11 @@ async def refresh_tokens(form: RefreshInput, db: DbDep, authenticator: Authentic
         logger.warning("token iat extraction failed", exc_info=True)
         raise InvalidRefreshTokenException() from e
 
-    # Fetch user by ID
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    # Fetch user by ID, loading only the columns token issuing and the response need
+    user_columns = load_only(
+        User.id, User.type, User.username, User.first_name, User.last_name, User.password_set_at, raiseload=True
+    )
+    user = await db.get(User, user_id, options=[user_columns])
     if user is None:
         raise InvalidRefreshTokenException()
 
@@ -85,10 +86,11 @@ async def refresh_tokens(form: RefreshInput, db: DbDep, authenticator: Authentic
 
     # Generate new tokens
     access_token, refresh_token = authenticator.encode(user)
-    return RefreshOutput(
+    # Same output shape as login: fresh tokens plus typed ORM columns of the user, so validation is skipped
+    return RefreshOutput.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
-        user=RefreshOutputUser(
+        user=RefreshOutputUser.model_construct(
             id=user.id,
             type=user.type,
             username=user.username,
@@ -1,7 +1,9 @@
+import asyncio
 import uuid
-from fastapi import APIRouter, status
+from fastapi import APIRouter, BackgroundTasks, status
 from pydantic import AwareDatetime, BaseModel, EmailStr, Field
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import IntegrityError
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.auth import AuthenticatorDep
@@ -17,6 +19,9 @@ from app.features.users.services.tasks.send_email_verification import (
 
 router = APIRouter()
 
+# The email lookup is built once at import; requests only bind the email.
+user_id_by_email_stmt = select(User.id).where(User.email == bindparam("email"))
+
 
 # Input/Output
 # ----------------------------------------------------------------------------------------------------------------------
@@ -74,55 +79,47 @@ async def register(
     authenticator: AuthenticatorDep,
     audit_logger: AuditLoggerDep,
     send_email_verification_task: SendEmailVerificationTaskDep,
+    background_tasks: BackgroundTasks,
 ) -> RegisterOutput:
     """
     Register a new user and return access and refresh tokens.
     Username must be unique. Email (if provided) must also be unique.
     If an email is provided, a verification email will be sent to the user.
     """
-    # Check if username or email already exists
-    username_check_stmt = select(User).where(User.username == form.username)
-    username_check_result = await db.execute(username_check_stmt)
-    username_check_user = username_check_result.scalar_one_or_none()
-    if username_check_user is not None:
-        raise UsernameExistsException()
-
-    # Check email if provided
-    if form.email is not None:
-        email_check_stmt = select(User).where(User.email == form.email)
-        email_check_result = await db.execute(email_check_stmt)
-        email_check_user = email_check_result.scalar_one_or_none()
-        if email_check_user is not None:
-            raise EmailExistsException()
-
     # Create user
     user = User(
-        id=uuid.uuid4(),
+        id=uuid.uuid7(),
         username=form.username,
         type=UserType.CUSTOMER,
         first_name=form.first_name,
         last_name=form.last_name,
         joined_at=utc_now(),
     )
-    user.set_password(form.password)
-    db.add(user)
-
-    # Finalize creation
-    await audit_logger.record("create", user)
-    await db.commit()
-    await db.refresh(user)
-
-    # Send email verification if email provided
+    await asyncio.to_thread(user.set_password, form.password)
+
+    # The unique constraint on username is authoritative, so a conflicting insert means the username is taken.
+    # This also covers concurrent registrations that a prior existence check would race with.
+    # The insert runs in a savepoint so a conflict leaves the session's transaction usable.
+    try:
+        async with db.begin_nested():
+            db.add(user)
+            await audit_logger.record("create", user)
+    except IntegrityError as e:
+        raise UsernameExistsException() from e
+
+    # Check email if provided (it is only stored on the user once verified, so no constraint covers it here)
     if form.email is not None:
-        task_input = SendEmailVerificationInput(user_id=user.id, email=form.email)
-        await send_email_verification_task.submit(task_input)
+        email_check_user_id = await db.scalar(user_id_by_email_stmt, {"email": form.email})
+        if email_check_user_id is not None:
+            raise EmailExistsException()
 
-    # Generate tokens and return response
+    # Generate tokens and build the response before commit expires the user, so no refresh is needed.
+    # The user fields were set from the already validated form, so the output models skip validation.
     access_token, refresh_token = authenticator.encode(user)
-    return RegisterOutput(
+    response = RegisterOutput.model_construct(
         access_token=access_token,
         refresh_token=refresh_token,
-        user=RegisterOutputUser(
+        user=RegisterOutputUser.model_construct(
             id=user.id,
             type=user.type,
             username=user.username,
@@ -131,3 +128,14 @@ async def register(
             joined_at=user.joined_at,
         ),
     )
+
+    # Finalize creation
+    await db.commit()
+
+    # Send email verification if email provided, submitting the task once the response has been sent.
+    # The user is already committed, so the task can always find it.
+    if form.email is not None:
+        task_input = SendEmailVerificationInput(user_id=response.user.id, email=form.email)
+        background_tasks.add_task(send_email_verification_task.submit, task_input)
+
+    return response
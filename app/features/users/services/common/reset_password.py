@@ -1,15 +1,20 @@
 import logging
 from fastapi import APIRouter
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from app.core.database import DbDep
+from app.core.exceptions import raises
+from app.core.rate_limit import RateLimitExceededException, rate_limit
 from app.features.users.models.user import User
 from app.features.users.services.tasks.send_password_reset_email import SendPasswordResetInput, SendPasswordResetTaskDep
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Statement is built once; each request only binds the email.
+user_id_by_email_stmt = select(User.id).where(User.email == bindparam("email"))
+
 
 # Input/Output
 # ----------------------------------------------------------------------------------------------------------------------
@@ -27,7 +32,9 @@ class ResetPasswordOutput(BaseModel):
 # ----------------------------------------------------------------------------------------------------------------------
 
 
+@raises(RateLimitExceededException)
 @router.post("/reset-password")
+@rate_limit("5/minute")
 async def reset_password(
     form: ResetPasswordInput, db: DbDep, send_password_reset_task: SendPasswordResetTaskDep
 ) -> ResetPasswordOutput:
@@ -35,17 +42,17 @@ async def reset_password(
     Initiate a password reset by sending a reset email to the user's email address.
     If the email does not exist, the response is the same to avoid disclosing user existence.
     The user must have a verified email to receive the reset email.
+
+    This endpoint is rate-limited per client so repeated or enumerating requests do not reach the database.
     """
     # Retrieve the user by email
-    stmt = select(User).where(User.email == form.email)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-    if user is None:
-        logger.info(f"Password reset requested for non-existent email: {form.email}")
+    user_id = await db.scalar(user_id_by_email_stmt, {"email": form.email})
+    if user_id is None:
+        logger.info("Password reset requested for non-existent email", extra={"email": form.email})
         return ResetPasswordOutput()
 
     # Submit background task
-    task_input = SendPasswordResetInput(user_id=user.id, email=form.email)
+    task_input = SendPasswordResetInput(user_id=user_id, email=form.email)
     await send_password_reset_task.submit(task_input)
-    logger.info("Password reset email task submitted", extra={"user_id": str(user.id), "email": form.email})
+    logger.info("Password reset email task submitted", extra={"user_id": str(user_id), "email": form.email})
     return ResetPasswordOutput()
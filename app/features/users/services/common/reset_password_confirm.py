@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import uuid
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import contains_eager
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.database import DbDep
@@ -13,6 +14,14 @@ from app.features.users.models.user_action import UserAction, UserActionState, U
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Statement is built once at import and reused with only the action id bound per request.
+action_with_user_stmt = (
+    select(UserAction)
+    .join(UserAction.user)
+    .options(contains_eager(UserAction.user))
+    .where(UserAction.id == bindparam("action_id"))
+)
+
 
 # Input/Output
 # ----------------------------------------------------------------------------------------------------------------------
@@ -58,14 +67,8 @@ async def reset_password_confirm(
     Reset a user's password using a valid action token.
     Previously issued refresh tokens will be invalidated.
     """
-    # Fetch action by ID
-    stmt = (
-        select(UserAction)
-        .join(UserAction.user)
-        .options(joinedload(UserAction.user))
-        .where(UserAction.id == form.action_id)
-    )
-    result = await db.execute(stmt)
+    # Fetch action by ID, populating the user from the same join
+    result = await db.execute(action_with_user_stmt, {"action_id": form.action_id})
     action = result.scalar_one_or_none()
     if action is None:
         raise ActionNotFoundException()
@@ -77,7 +80,7 @@ async def reset_password_confirm(
         raise InvalidActionTokenException()
 
     # Reset password
-    action.user.set_password(form.new_password)
+    await asyncio.to_thread(action.user.set_password, form.new_password)
     action.state = UserActionState.COMPLETED
 
     # Finalize
@@ -84,3 +84,27 @@ async def test_user_cannot_refresh_token_with_expired_token(
         response = test_client_fixture.post(URL, json={"refresh_token": refresh_token})
         assert response.status_code == 401
         assert response.json()["type"] == "users/common/refresh-tokens/invalid-refresh-token"
+
+
+@pytest.mark.asyncio
+async def test_user_can_refresh_token_when_user_is_loaded_fresh_from_database(
+    test_client_fixture: TestClient, db_fixture: AsyncSession, authenticator_fixture: Authenticator
+):
+    with time_machine.travel("2025-01-01 00:00:00"):
+        user: User = UserFactory.build(password__raw="testpassword")
+        db_fixture.add(user)
+        await db_fixture.commit()
+        await db_fixture.refresh(user)
+        user_id, username = user.id, user.username
+
+    with time_machine.travel("2025-01-01 00:05:00"):
+        _, refresh_token = authenticator_fixture.encode(user)
+        db_fixture.expunge_all()
+
+        response = test_client_fixture.post(URL, json={"refresh_token": refresh_token})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["user"]["id"] == str(user_id)
+        assert data["user"]["username"] == username
+        assert authenticator_fixture.sub(data["access_token"]) == user_id
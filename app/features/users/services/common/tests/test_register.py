@@ -1,10 +1,12 @@
 from unittest.mock import AsyncMock
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 import pytest
 
+from app.core.database import create_db_engine_from_settings, get_db_session
+from app.core.settings import Settings
 from app.features.users.models.user import User
 from app.features.users.services.tasks.send_email_verification import (
     SendEmailVerificationInput,
@@ -43,6 +45,7 @@ async def test_user_can_register_with_valid_data(
     assert user is not None
     assert user.check_password(user_data["password"])
     assert user.email is None
+    assert user.id.version == 7
 
     mocked_task.submit.assert_called_once()
     task_input = mocked_task.submit.call_args[0][0]
@@ -86,3 +89,61 @@ async def test_user_cannot_register_with_existing_email(test_client_fixture: Tes
     response = test_client_fixture.post(URL, json=user_data)
     assert response.status_code == 400
     assert response.json()["type"] == "users/common/register/email-exists"
+
+
+@pytest.mark.asyncio
+async def test_user_cannot_register_with_username_and_email_taken_by_different_users(
+    test_client_fixture: TestClient, db_fixture: AsyncSession
+):
+    username_user: User = UserFactory.build(username="takenusername")
+    email_user: User = UserFactory.build(email="taken@example.com")
+    db_fixture.add_all([username_user, email_user])
+    await db_fixture.commit()
+
+    user_data = {
+        "username": "takenusername",
+        "first_name": "Another",
+        "last_name": "User",
+        "password": "anotherpassword",
+        "email": "taken@example.com",
+    }
+    response = test_client_fixture.post(URL, json=user_data)
+    assert response.status_code == 400
+    assert response.json()["type"] == "users/common/register/username-exists"
+
+
+@pytest.mark.asyncio
+async def test_user_is_not_created_on_email_conflict_without_outer_transaction(
+    fastapi_app_fixture: FastAPI, test_client_fixture: TestClient, settings_fixture: Settings
+):
+    # The app's own engine and sessions, without the rollback-only outer transaction of db_fixture
+    session_maker = async_sessionmaker(create_db_engine_from_settings(settings_fixture))
+    existing_user: User = UserFactory.build(username="unwrappedexisting", email="unwrapped@example.com")
+    async with session_maker() as session:
+        session.add(existing_user)
+        await session.commit()
+
+    async def get_unwrapped_db_session():
+        async with session_maker() as session:
+            yield session
+
+    fastapi_app_fixture.dependency_overrides[get_db_session] = get_unwrapped_db_session
+    try:
+        user_data = {
+            "username": "unwrappednew",
+            "first_name": "Another",
+            "last_name": "User",
+            "password": "anotherpassword",
+            "email": "unwrapped@example.com",
+        }
+        response = test_client_fixture.post(URL, json=user_data)
+        assert response.status_code == 400
+        assert response.json()["type"] == "users/common/register/email-exists"
+
+        async with session_maker() as session:
+            created_user_id = await session.scalar(select(User.id).where(User.username == "unwrappednew"))
+        assert created_user_id is None
+    finally:
+        async with session_maker() as session:
+            await session.execute(delete(User).where(User.username.in_(["unwrappedexisting", "unwrappednew"])))
+            await session.commit()
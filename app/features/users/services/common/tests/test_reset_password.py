@@ -50,3 +50,18 @@ async def test_user_cannot_reset_password_with_nonexistent_email(
     assert response.status_code == 200
 
     mocked_task.submit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reset_password_is_rate_limited(test_client_fixture: TestClient, fastapi_app_fixture: FastAPI):
+    mocked_task = AsyncMock()
+    fastapi_app_fixture.dependency_overrides[send_password_reset_email] = lambda: mocked_task
+
+    for i in range(5):
+        response = test_client_fixture.post(URL, json={"email": f"unknown{i}@example.com"})
+        assert response.status_code == 200
+
+    response = test_client_fixture.post(URL, json={"email": "unknown5@example.com"})
+    assert response.status_code == 429
+    assert response.json()["type"] == "rate-limit/exceeded"
+    mocked_task.submit.assert_not_called()
@@ -1,6 +1,6 @@
 import uuid
 from fastapi import APIRouter, status
-from pydantic import AwareDatetime, BaseModel, EmailStr, Field
+from pydantic import AwareDatetime, BaseModel, ConfigDict, EmailStr, Field
 from sqlalchemy import select
 
 from app.core.audit_log import AuditLoggerDep
@@ -28,6 +28,8 @@ class UpdateMeInput(BaseModel):
 
 
 class UpdateMeOutput(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: uuid.UUID
     type: UserType
     username: str
@@ -77,9 +79,7 @@ async def update_me(
     The email update will only take effect after verification.
     """
     # Fetch user from database
-    stmt = select(User).where(User.id == current_user.id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await db.get(User, current_user.id)
     if user is None:
         raise UserNotFoundException()
 
@@ -91,10 +91,9 @@ async def update_me(
 
     # If email is being updated, check for uniqueness and send verification email
     if form.email is not None and user.email != form.email:
-        email_stmt = select(User).where(User.email == form.email).where(User.id != user.id)
-        email_result = await db.execute(email_stmt)
-        email_user = email_result.scalar_one_or_none()
-        if email_user is not None:
+        email_stmt = select(User.id).where(User.email == form.email).where(User.id != user.id)
+        email_user_id = await db.scalar(email_stmt)
+        if email_user_id is not None:
             raise EmailExistsException()
 
         task_input = SendEmailVerificationInput(user_id=user.id, email=form.email)
@@ -105,14 +104,4 @@ async def update_me(
     await db.commit()
     await db.refresh(user)
 
-    return UpdateMeOutput(
-        id=user.id,
-        type=user.type,
-        username=user.username,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        email=user.email,
-        joined_at=user.joined_at,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return UpdateMeOutput.model_validate(user)
@@ -2,7 +2,7 @@ import uuid
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 
 from app.core.audit_log import AuditLoggerDep
 from app.core.database import DbDep
@@ -72,7 +72,7 @@ async def verify_email_confirm(
     stmt = (
         select(UserAction)
         .join(UserAction.user)
-        .options(joinedload(UserAction.user))
+        .options(contains_eager(UserAction.user))
         .where(UserAction.id == form.action_id)
     )
     result = await db.execute(stmt)
@@ -93,10 +93,9 @@ async def verify_email_confirm(
     user_id = user.id
 
     # Check if email is already used by another user
-    email_other_stmt = select(User).where(User.email == action_email).where(User.id != user_id)
-    email_other_result = await db.execute(email_other_stmt)
-    email_other_user = email_other_result.scalar_one_or_none()
-    if email_other_user is not None:
+    email_other_stmt = select(User.id).where(User.email == action_email).where(User.id != user_id)
+    email_other_user_id = await db.scalar(email_other_stmt)
+    if email_other_user_id is not None:
         raise EmailAlreadyInUseException()
 
     # Update user email and action state
@@ -121,13 +120,13 @@ async def verify_email_confirm(
     )
     db.add(notification)
 
-    # Finalize
+    # Finalize, keeping the notification id since commit expires the instance (no refresh needed)
+    notification_id = notification.id
     await audit_logger.record("verify_email", user)
     await db.commit()
-    await db.refresh(notification)
 
     # Send welcome notification
-    task_input = SendNotificationInput(notification_id=notification.id)
+    task_input = SendNotificationInput(notification_id=notification_id)
     await send_notification_task.submit(task_input)
 
     return VerifyEmailOutput(user_id=user_id, email=action_email)
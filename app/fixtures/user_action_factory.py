@@ -1,9 +1,17 @@
 from datetime import timezone
+import functools
 import factory
 
+from app.features.users.models.user import password_hasher
 from app.features.users.models.user_action import UserAction, UserActionType, UserActionState
 
 
+# Tokens are hashed with Argon2 like passwords, so actions built with the same raw token share a single hash.
+@functools.cache
+def hashed_test_token(raw_token: str) -> str:
+    return password_hasher.hash(raw_token)
+
+
 class UserActionFactory(factory.Factory[UserAction]):
     class Meta:  # pyright: ignore[reportIncompatibleVariableOverride]
         model = UserAction
@@ -15,5 +23,6 @@ class UserActionFactory(factory.Factory[UserAction]):
     @factory.post_generation
     def token(self, create: object, extracted: object, **kwargs: object):
         raw_token = str(kwargs.get("raw", "testtoken"))
-        assert isinstance(self, UserAction), "sanity check failed"
-        self.set_token(raw_token)
+        action = self
+        assert isinstance(action, UserAction), "sanity check failed"
+        action.hashed_token = hashed_test_token(raw_token)
@@ -1,7 +1,15 @@
 from datetime import timezone
+import functools
 import factory
 
-from app.features.users.models.user import UserType, User
+from app.core.timezone import utc_now
+from app.features.users.models.user import UserType, User, password_hasher
+
+
+# Argon2 hashing is deliberately slow, so users built with the same raw password share a single hash.
+@functools.cache
+def hashed_test_password(raw_password: str) -> str:
+    return password_hasher.hash(raw_password)
 
 
 class UserFactory(factory.Factory[User]):
@@ -19,5 +27,7 @@ class UserFactory(factory.Factory[User]):
     @factory.post_generation
     def password(self, create: object, extracted: object, **kwargs: object):
         raw_password = str(kwargs.get("raw", "testpassword"))
-        assert isinstance(self, User), "sanity check failed"
-        self.set_password(raw_password)
+        user = self
+        assert isinstance(user, User), "sanity check failed"
+        user.hashed_password = hashed_test_password(raw_password)
+        user.password_set_at = utc_now()
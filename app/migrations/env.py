@@ -7,6 +7,7 @@ Important: This file
 """
 
 import asyncio
+import logging
 from typing import Literal
 
 from sqlalchemy import pool
@@ -38,6 +39,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         render_item=render_item,
+        render_as_batch=True,
     )
 
     with context.begin_transaction():
@@ -50,7 +52,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata, render_item=render_item)
+    # Autogenerate groups per-table operations into batch_alter_table blocks, so SQLite copies a table once
+    # for all of a migration's changes to it instead of once per operation. PostgreSQL still alters in place.
+    context.configure(
+        connection=connection, target_metadata=target_metadata, render_item=render_item, render_as_batch=True
+    )
     with context.begin_transaction():
         context.run_migrations()
 
@@ -83,7 +89,10 @@ def render_item(type_: str, col: object, autogen_context: AutogenContext) -> str
 
 
 settings = get_settings()
-setup_logging(settings)
+# Set up logging only when invoked from the alembic CLI; when migrations run inside the app or the tests,
+# logging is already configured. Offline mode writes the SQL script to stdout, so it is kept free of log output.
+if not context.is_offline_mode() and not logging.getLogger().handlers:
+    setup_logging(settings)
 if context.is_offline_mode():
     run_migrations_offline()
 else:
@@ -0,0 +1,25 @@
+"""
+Add user keyset pagination indexes
+
+Revision ID: 9c1e4b7d2a6f
+Revises: b34dec213535
+Create Date: 2026-10-17 10:45:12.408113
+"""
+
+from alembic import op
+
+
+revision = "9c1e4b7d2a6f"
+down_revision = "b34dec213535"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], unique=False)
+    op.create_index("ix_users_updated_at_id", "users", ["updated_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_updated_at_id", table_name="users")
+    op.drop_index("ix_users_created_at_id", table_name="users")
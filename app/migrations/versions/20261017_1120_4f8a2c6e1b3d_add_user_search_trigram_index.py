@@ -0,0 +1,32 @@
+"""
+Add user search trigram index
+
+Revision ID: 4f8a2c6e1b3d
+Revises: 9c1e4b7d2a6f
+Create Date: 2026-10-17 11:20:41.736529
+"""
+
+from alembic import op
+
+
+revision = "4f8a2c6e1b3d"
+down_revision = "9c1e4b7d2a6f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trigram indexes are PostgreSQL only; other backends keep scanning for searches.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_users_search_trgm ON users "
+        "USING gin (lower(username || ' ' || first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX ix_users_search_trgm")
@@ -0,0 +1,66 @@
+"""
+Store enums as varchar
+
+Revision ID: e7b2d9a4c5f1
+Revises: 4f8a2c6e1b3d
+Create Date: 2026-10-17 13:40:12.508316
+"""
+
+import itertools
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "e7b2d9a4c5f1"
+down_revision = "4f8a2c6e1b3d"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, enum type name, members)
+enum_columns = [
+    ("users", "type", "usertype", ("ADMIN", "CUSTOMER")),
+    ("notifications", "type", "notificationtype", ("CUSTOM", "WELCOME")),
+    ("notification_delivery", "channel", "notificationchannel", ("EMAIL", "SMS", "INAPP")),
+    ("notification_delivery", "status", "notificationstatus", ("PENDING", "SENT", "FAILED")),
+    ("audit_logs", "actor_type", "actortype", ("USER", "SYSTEM", "ANONYMOUS")),
+    ("user_actions", "type", "useractiontype", ("EMAIL_VERIFICATION", "PASSWORD_RESET")),
+    ("user_actions", "state", "useractionstate", ("PENDING", "COMPLETED", "OBSOLETE")),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, name, members in enum_columns:
+            op.alter_column(table, column, type_=sa.String(32), postgresql_using=f"{column}::text")
+            op.create_check_constraint(name, table, sa.column(column).in_(members))
+            sa.Enum(*members, name=name).drop(op.get_bind())
+        return
+    # Other backends already store these columns as VARCHAR sized to the longest member, without a constraint.
+    # SQLite cannot alter columns in place, so batch mode rebuilds each table once with all of its changes.
+    for table, columns in itertools.groupby(enum_columns, key=lambda item: item[0]):
+        with op.batch_alter_table(table) as batch_op:
+            for _, column, name, members in columns:
+                batch_op.alter_column(column, type_=sa.String(32), existing_nullable=False)
+                batch_op.create_check_constraint(name, sa.column(column).in_(members))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, name, members in enum_columns:
+            op.drop_constraint(name, table, type_="check")
+            sa.Enum(*members, name=name).create(op.get_bind())
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.ENUM(*members, name=name, create_type=False),
+                postgresql_using=f"{column}::{name}",
+            )
+        return
+    for table, columns in itertools.groupby(enum_columns, key=lambda item: item[0]):
+        with op.batch_alter_table(table) as batch_op:
+            for _, column, name, members in columns:
+                batch_op.drop_constraint(name, type_="check")
+                batch_op.alter_column(column, type_=sa.Enum(*members, name=name), existing_nullable=False)
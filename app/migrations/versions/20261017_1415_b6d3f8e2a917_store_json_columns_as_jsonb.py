@@ -0,0 +1,43 @@
+"""
+Store json columns as jsonb
+
+Revision ID: b6d3f8e2a917
+Revises: e7b2d9a4c5f1
+Create Date: 2026-10-17 14:15:37.204861
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "b6d3f8e2a917"
+down_revision = "e7b2d9a4c5f1"
+branch_labels = None
+depends_on = None
+
+
+# (table, column)
+json_columns = [
+    ("user_actions", "data"),
+    ("notifications", "data"),
+    ("audit_logs", "old_value"),
+    ("audit_logs", "new_value"),
+    ("audit_logs", "changed_value"),
+    ("preferences", "value"),
+]
+
+
+def upgrade() -> None:
+    # JSONB is PostgreSQL only; other backends keep storing plain JSON.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in json_columns:
+        op.alter_column(table, column, type_=postgresql.JSONB(), postgresql_using=f"{column}::jsonb")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in json_columns:
+        op.alter_column(table, column, type_=sa.JSON(), postgresql_using=f"{column}::json")
@@ -0,0 +1,29 @@
+"""
+Add notification delivery covering index
+
+Revision ID: d41a7c9e3b58
+Revises: b6d3f8e2a917
+Create Date: 2026-10-17 14:50:09.613472
+"""
+
+from alembic import op
+
+
+revision = "d41a7c9e3b58"
+down_revision = "b6d3f8e2a917"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notification_delivery_notification_id",
+        "notification_delivery",
+        ["notification_id"],
+        unique=False,
+        postgresql_include=["channel", "status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_delivery_notification_id", table_name="notification_delivery")
@@ -1,5 +1,3 @@
-import uvicorn
-
 from app.celery import create_celery_app
 from app.core.storage import setup_storage
 from app.fastapi import create_fastapi_app
@@ -14,4 +12,7 @@ app = create_fastapi_app(global_settings)
 _ = create_celery_app(global_settings)
 
 if __name__ == "__main__":
+    # Only needed when run directly; servers importing this module already have uvicorn loaded.
+    import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=8000)